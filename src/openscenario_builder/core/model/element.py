@@ -3,16 +3,55 @@ Enhanced Element Model for OpenSCENARIO Builder
 Provides a robust, validated element structure with metadata support
 """
 
+import sys
+from types import MappingProxyType
 from openscenario_builder.interfaces import IElement, IElementMetadata
-from typing import Dict, List, Optional, Any
-from xml.etree.ElementTree import Element as XMLElement, tostring
-from xml.dom import minidom
+from typing import Dict, Iterable, List, Mapping, Optional, Any
+from xml.etree.ElementTree import (
+    Element as XMLElement,
+    SubElement,
+    indent,
+    tostring,
+)
 from datetime import datetime
 
+# Declaration line written before pretty-printed XML
+_XML_DECLARATION = '<?xml version="1.0" ?>\n'
+
+
+# Shared by all elements without attributes; many elements in a scenario
+# have none, so they do not each get an empty dict. attrs only hands out
+# read-only views and set_attribute swaps in a real dict, so it is never
+# written to.
+_NO_ATTRS: Dict[str, str] = {}
+_NO_ATTRS_VIEW: Mapping[str, str] = MappingProxyType(_NO_ATTRS)
+
+
+def _group_by_tag(children: List[IElement]) -> Dict[str, List[IElement]]:
+    """Group children by tag, keeping document order within each tag"""
+    by_tag: Dict[str, List[IElement]] = {}
+    for child in children:
+        tag = child.tag
+        bucket = by_tag.get(tag)
+        if bucket is None:
+            by_tag[tag] = [child]
+        else:
+            bucket.append(child)
+    return by_tag
+
 
 class ElementMetadata(IElementMetadata):
     """Metadata for an element"""
 
+    __slots__ = (
+        "_created_at",
+        "_modified_at",
+        "_created_by",
+        "_description",
+        "_tags",
+        "_validation_errors",
+    )
+
     def __init__(
         self,
         created_at: Optional[datetime] = None,
@@ -22,12 +61,17 @@ class ElementMetadata(IElementMetadata):
         tags: Optional[List[str]] = None,
         validation_errors: Optional[List[str]] = None,
     ):
-        self._created_at = created_at or datetime.now()
-        self._modified_at = modified_at or datetime.now()
+        if created_at is None or modified_at is None:
+            now = datetime.now()
+            created_at = created_at or now
+            modified_at = modified_at or now
+        self._created_at = created_at
+        self._modified_at = modified_at
         self._created_by = created_by
         self._description = description
-        self._tags = tags or []
-        self._validation_errors = validation_errors or []
+        # Most elements never use these lists; allocate them on first access
+        self._tags: Optional[List[str]] = tags or None
+        self._validation_errors: Optional[List[str]] = validation_errors or None
 
     @property
     def created_at(self) -> datetime:
@@ -51,18 +95,52 @@ class ElementMetadata(IElementMetadata):
 
     @property
     def tags(self) -> List[str]:
-        return self._tags
+        tags = self._tags
+        if tags is None:
+            tags = self._tags = []
+        return tags
 
     @property
     def validation_errors(self) -> List[str]:
-        return self._validation_errors
+        errors = self._validation_errors
+        if errors is None:
+            errors = self._validation_errors = []
+        return errors
+
+    def copy(self) -> "ElementMetadata":
+        """Create an independent copy of this metadata"""
+        tags = self._tags
+        errors = self._validation_errors
+        return ElementMetadata(
+            created_at=self._created_at,
+            modified_at=self._modified_at,
+            created_by=self._created_by,
+            description=self._description,
+            tags=list(tags) if tags else None,
+            validation_errors=list(errors) if errors else None,
+        )
 
 
 class Element(IElement):
     """
     Enhanced Element class with validation, metadata, and XML handling
+
+    Elements compare and hash by identity, so child membership checks and
+    element-keyed lookups never compare whole subtrees.
     """
 
+    # Scenario trees hold many elements; avoid a __dict__ per instance
+    __slots__ = (
+        "_tag",
+        "_attrs",
+        "_attrs_view",
+        "_attrs_text",
+        "_children",
+        "_metadata",
+        "_by_tag",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         tag: str,
@@ -70,10 +148,25 @@ class Element(IElement):
         children: Optional[List[IElement]] = None,
         metadata: Optional[ElementMetadata] = None,
     ):
-        self._tag = tag
-        self._attrs = attrs or {}
+        # Tags and attribute names are reused across the tree and used as
+        # schema lookup keys
+        self._tag = sys.intern(tag)
+        if attrs:
+            self._attrs = {sys.intern(k): v for k, v in attrs.items()}
+            # Read-only view handed out by attrs, created on first use
+            self._attrs_view: Optional[Mapping[str, str]] = None
+        else:
+            self._attrs = _NO_ATTRS
+            self._attrs_view = _NO_ATTRS_VIEW
+        # Rendered attribute text, built on first use
+        self._attrs_text: Optional[str] = None
         self._children: List[IElement] = children or []
-        self._metadata = metadata or ElementMetadata()
+        # Created on first access or edit; most parsed elements never need it
+        self._metadata: Optional[ElementMetadata] = metadata
+
+        # Children grouped by tag, in document order, for tag lookups. Only
+        # tags with at least one child have a bucket.
+        self._by_tag = _group_by_tag(self._children)
 
     @property
     def tag(self) -> str:
@@ -81,9 +174,22 @@ class Element(IElement):
         return self._tag
 
     @property
-    def attrs(self) -> Dict[str, str]:
-        """Element attributes"""
-        return self._attrs
+    def attrs(self) -> Mapping[str, str]:
+        """Read-only view of the attributes; use set_attribute to change them"""
+        view = self._attrs_view
+        if view is None:
+            view = self._attrs_view = MappingProxyType(self._attrs)
+        return view
+
+    @property
+    def attrs_text(self) -> str:
+        """Attributes rendered as 'name="value"' pairs for display"""
+        text = self._attrs_text
+        if text is None:
+            text = self._attrs_text = " ".join(
+                [f'{k}="{v}"' for k, v in self._attrs.items()]
+            )
+        return text
 
     @property
     def children(self) -> List[IElement]:
@@ -93,43 +199,70 @@ class Element(IElement):
     @property
     def metadata(self) -> IElementMetadata:
         """Element metadata"""
-        return self._metadata
+        metadata = self._metadata
+        if metadata is None:
+            metadata = self._metadata = ElementMetadata()
+        return metadata
+
+    def _touch(self) -> None:
+        """Record a modification in the metadata"""
+        now = datetime.now()
+        if self._metadata is None:
+            self._metadata = ElementMetadata(created_at=now, modified_at=now)
+        else:
+            self._metadata.modified_at = now
 
     def add_child(self, child: IElement) -> None:
         """Add a child element"""
         if child not in self._children:
             self._children.append(child)
-            self._metadata.modified_at = datetime.now()
+            self._by_tag.setdefault(child.tag, []).append(child)
+            self._touch()
 
     def remove_child(self, child: IElement) -> bool:
         """Remove a child element, returns True if found and removed"""
         if child in self._children:
             self._children.remove(child)
-            self._metadata.modified_at = datetime.now()
+            bucket = self._by_tag[child.tag]
+            bucket.remove(child)
+            if not bucket:
+                del self._by_tag[child.tag]
+            self._touch()
             return True
         return False
 
     def insert_child(self, index: int, child: IElement) -> None:
         """Insert a child element at a specific index"""
         if child not in self._children:
+            appended = index >= len(self._children)
             self._children.insert(index, child)
-            self._metadata.modified_at = datetime.now()
+            tag = child.tag
+            if appended:
+                self._by_tag.setdefault(tag, []).append(child)
+            else:
+                # Keep the tag index in document order
+                self._by_tag[tag] = [c for c in self._children if c.tag == tag]
+            self._touch()
 
     def get_child_by_tag(self, tag: str) -> Optional[IElement]:
         """Get the first child element with the specified tag"""
-        for child in self._children:
-            if child.tag == tag:
-                return child
-        return None
+        children = self._by_tag.get(tag)
+        return children[0] if children else None
 
     def get_children_by_tag(self, tag: str) -> List[IElement]:
         """Get all child elements with the specified tag"""
-        return [child for child in self._children if child.tag == tag]
+        children = self._by_tag.get(tag)
+        return children.copy() if children else []
 
     def set_attribute(self, name: str, value: str) -> None:
         """Set an attribute value"""
-        self._attrs[name] = value
-        self._metadata.modified_at = datetime.now()
+        attrs = self._attrs
+        if attrs is _NO_ATTRS:
+            attrs = self._attrs = {}
+            self._attrs_view = None
+        attrs[sys.intern(name)] = value
+        self._attrs_text = None
+        self._touch()
 
     def get_attribute(self, name: str, default: str = "") -> str:
         """Get an attribute value"""
@@ -139,7 +272,8 @@ class Element(IElement):
         """Remove an attribute, returns True if found and removed"""
         if name in self._attrs:
             del self._attrs[name]
-            self._metadata.modified_at = datetime.now()
+            self._attrs_text = None
+            self._touch()
             return True
         return False
 
@@ -149,10 +283,19 @@ class Element(IElement):
 
     def to_etree_element(self) -> XMLElement:
         """Convert to XML ElementTree element"""
-        elem = XMLElement(self._tag, {k: str(v) for k, v in self._attrs.items()})
-        for child in self._children:
-            elem.append(child.to_etree_element())
-        return elem
+        # Walk with an explicit stack so deep scenarios cannot hit the
+        # recursion limit
+        root = XMLElement(self._tag, {k: str(v) for k, v in self._attrs.items()})
+        stack: List[tuple] = [(self, root)]
+        while stack:
+            source, target = stack.pop()
+            for child in source.children:
+                elem = SubElement(
+                    target, child.tag, {k: str(v) for k, v in child.attrs.items()}
+                )
+                if child.children:
+                    stack.append((child, elem))
+        return root
 
     def to_xml_string(self, pretty: bool = True, encoding: str = "unicode") -> str:
         """Convert to XML string"""
@@ -160,21 +303,15 @@ class Element(IElement):
             # Convert to ElementTree first
             etree_elem = self.to_etree_element()
 
-            # Convert to string
             if pretty:
-                # Pretty print with indentation using a cleaner approach
-                rough_string = tostring(etree_elem, encoding=encoding)
-
-                # Clean up any namespace prefixes that might have been added
-                rough_string = self._clean_namespace_prefixes(rough_string)
-
-                reparsed = minidom.parseString(rough_string)
-                pretty_xml = reparsed.toprettyxml(indent="  ")
-
-                # Clean up any remaining namespace prefixes
-                pretty_xml = self._clean_namespace_prefixes(pretty_xml)
+                # Indent in place and serialize once, instead of reparsing
+                # the compact output with minidom
+                indent(etree_elem, space="  ")
+                xml_string = tostring(etree_elem, encoding=encoding)
+                xml_string = self._clean_namespace_prefixes(xml_string)
 
-                return pretty_xml.strip()
+                # Keep the declaration and empty-tag style minidom produced
+                return _XML_DECLARATION + xml_string.replace(" />", "/>")
             else:
                 # Compact output
                 xml_string = tostring(etree_elem, encoding=encoding)
@@ -195,40 +332,56 @@ class Element(IElement):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
+        metadata = self.metadata
         return {
             "tag": self._tag,
-            "attrs": self._attrs,
+            "attrs": dict(self._attrs),
             "children": [child.to_dict() for child in self._children],
             "metadata": {
-                "created_at": self._metadata.created_at.isoformat(),
-                "modified_at": self._metadata.modified_at.isoformat(),
-                "created_by": self._metadata.created_by,
-                "description": self._metadata.description,
-                "tags": self._metadata.tags,
+                "created_at": metadata.created_at.isoformat(),
+                "modified_at": metadata.modified_at.isoformat(),
+                "created_by": metadata.created_by,
+                "description": metadata.description,
+                "tags": metadata.tags,
             },
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Element":
         """Create Element from dictionary representation"""
-        element = cls(
-            tag=data["tag"],
-            attrs=data.get("attrs", {}),
-            metadata=ElementMetadata(
-                created_at=datetime.fromisoformat(data["metadata"]["created_at"]),
-                modified_at=datetime.fromisoformat(data["metadata"]["modified_at"]),
-                created_by=data["metadata"]["created_by"],
-                description=data["metadata"]["description"],
-                tags=data["metadata"]["tags"],
-            ),
-        )
-
-        # Add children recursively
-        for child_data in data.get("children", []):
-            child = cls.from_dict(child_data)
-            element.add_child(child)
+        root = cls._node_from_dict(data)
+
+        # Build the subtree with an explicit stack so deep trees do not hit
+        # the recursion limit. Children are attached directly: they are new
+        # objects, so add_child's duplicate check and timestamp are not needed
+        stack = [(data, root)]
+        while stack:
+            source, element = stack.pop()
+            children_data = source.get("children")
+            if not children_data:
+                continue
+            children = [cls._node_from_dict(child_data) for child_data in children_data]
+            element._children.extend(children)
+            element._by_tag = _group_by_tag(children)
+            stack.extend(zip(children_data, children))
+
+        return root
 
-        return element
+    @classmethod
+    def _node_from_dict(cls, data: Dict[str, Any]) -> "Element":
+        """Create an element from its dictionary without its children"""
+        metadata = None
+        meta = data.get("metadata")
+        if meta is not None:
+            fromisoformat = datetime.fromisoformat
+            metadata = ElementMetadata(
+                created_at=fromisoformat(meta["created_at"]),
+                modified_at=fromisoformat(meta["modified_at"]),
+                created_by=meta["created_by"],
+                description=meta["description"],
+                tags=meta["tags"],
+            )
+        return cls(tag=data["tag"], attrs=data.get("attrs"), metadata=metadata)
 
     @classmethod
     def from_etree_element(cls, etree_elem: XMLElement) -> "Element":
@@ -244,16 +397,88 @@ class Element(IElement):
 
     def clone(self) -> "Element":
         """Create a deep copy of this element"""
-        return self.from_dict(self.to_dict())
+        cls = type(self)
+        root = cls._copy_node(self)
+
+        # Copy the subtree with an explicit stack so deep trees do not hit
+        # the recursion limit
+        stack = [(self, root)]
+        while stack:
+            source, copy = stack.pop()
+            children = source.children
+            if not children:
+                continue
+            copies = [cls._copy_node(child) for child in children]
+            copy._children.extend(copies)
+            copy._by_tag = _group_by_tag(copies)
+            stack.extend(zip(children, copies))
+
+        return root
+
+    @classmethod
+    def _copy_node(cls, source: IElement) -> "Element":
+        """Copy an element's tag, attributes and metadata without its children"""
+        # Fill the slots directly; the source's tag and attribute names are
+        # already interned, so __init__ would only redo that work
+        copy = cls.__new__(cls)
+        copy._tag = source.tag
+        attrs = source.attrs
+        if attrs:
+            copy._attrs = dict(attrs)
+            copy._attrs_view = None
+        else:
+            copy._attrs = _NO_ATTRS
+            copy._attrs_view = _NO_ATTRS_VIEW
+        copy._attrs_text = None
+        copy._children = []
+        copy._by_tag = {}
+        metadata = source._metadata if isinstance(source, Element) else source.metadata
+        if metadata is None:
+            # Not created yet on the source either
+            copy._metadata = None
+        else:
+            # Validation errors recorded by ElementFactory describe how the
+            # original was created, so the copy starts without them
+            tags = (
+                metadata._tags if type(metadata) is ElementMetadata else metadata.tags
+            )
+            copy._metadata = ElementMetadata(
+                created_at=metadata.created_at,
+                modified_at=metadata.modified_at,
+                created_by=metadata.created_by,
+                description=metadata.description,
+                tags=list(tags) if tags else None,
+            )
+        return copy
 
     def find_elements_by_tag(self, tag: str) -> List[IElement]:
         """Find all elements with the specified tag in the subtree"""
+        # Walk in document order with an explicit stack so deep trees do not
+        # hit the recursion limit
         results: List[IElement] = []
-        if self._tag == tag:
-            results.append(self)
+        stack: List[IElement] = [self]
+        while stack:
+            element = stack.pop()
+            if element.tag == tag:
+                results.append(element)
+            children = element.children
+            if children:
+                stack.extend(reversed(children))
+
+        return results
 
-        for child in self._children:
-            results.extend(child.find_elements_by_tag(tag))
+    def find_elements_by_tags(self, tags: Iterable[str]) -> Dict[str, List[IElement]]:
+        """Find elements for several tags in the subtree, keyed by tag"""
+        results: Dict[str, List[IElement]] = {tag: [] for tag in tags}
+
+        # Collect every requested tag in a single pre-order pass
+        stack: List[IElement] = [self]
+        while stack:
+            element = stack.pop()
+            bucket = results.get(element.tag)
+            if bucket is not None:
+                bucket.append(element)
+            stack.extend(reversed(element.children))
 
         return results
 
@@ -137,11 +137,7 @@ class ElementBuilder:
 
         element = self.factory.create(self._tag, self._attrs, self._children)
 
-        # Reset builder state
-        self._tag = None
-        self._attrs = {}
-        self._children = []
-
+        self.reset()
         return element
 
     def build_with_defaults(self) -> IElement:
@@ -165,12 +161,20 @@ class ElementBuilder:
         for child in self._children:
             element.add_child(child)
 
-        # Reset builder state
+        self.reset()
+        return element
+
+    def reset(self) -> "ElementBuilder":
+        """
+        Discard the tag, attributes and children set so far.
+
+        Returns:
+            Self for chaining
+        """
         self._tag = None
         self._attrs = {}
         self._children = []
-
-        return element
+        return self
 
     def get_required_attrs(self) -> List[str]:
         """
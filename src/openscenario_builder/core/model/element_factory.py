@@ -3,7 +3,7 @@ Schema-Aware Element Factory for OpenSCENARIO Builder
 Provides creation-time validation and type-safe element construction
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from openscenario_builder.interfaces import (
     ISchemaInfo,
     IElement,
@@ -38,12 +38,17 @@ class ElementFactory:
         """
         self.schema_info = schema_info
         self.strict = strict
-        # Track validation errors using element object as key
-        self._validation_errors: Dict[IElement, List[str]] = {}
+        # Required and optional attribute names per tag, split on first use
+        self._attr_names: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
         # Initialize validators (reuse existing validation logic)
         self._schema_validator = XoscSchemaStructureValidator()
         self._datatype_validator = XoscDataTypeValidator()
         self._structure_validator = XoscStructureValidator()
+        self._validators = (
+            self._schema_validator,
+            self._datatype_validator,
+            self._structure_validator,
+        )
 
     def create(
         self,
@@ -74,28 +79,26 @@ class ElementFactory:
         # Create the element first
         element = Element(tag, attrs, children)
 
-        # Reuse existing validators instead of custom validation logic
-        errors = []
-
-        # Schema structure validation (element exists, valid attributes, etc.)
-        schema_errors = self._schema_validator.validate(element, self.schema_info)
-        errors.extend(schema_errors)
-
-        # Data type validation (type checking, enumerations)
-        datatype_errors = self._datatype_validator.validate(element, self.schema_info)
-        errors.extend(datatype_errors)
-
-        # Basic structure validation
-        structure_errors = self._structure_validator.validate(element, self.schema_info)
-        errors.extend(structure_errors)
+        # Reuse existing validators instead of custom validation logic:
+        # - schema structure (element exists, valid attributes, etc.)
+        # - data types (type checking, enumerations)
+        # - basic document structure
+        errors: List[str] = []
+        for validator in self._validators:
+            errors.extend(validator.validate(element, self.schema_info))
+            if errors and use_strict:
+                # Strict mode raises on the first failing stage; the later
+                # validators cannot make the element valid again
+                break
 
         # Handle errors based on strict mode
         if errors:
             if use_strict:
                 raise ValueError(f"Validation failed for '{tag}': {'; '.join(errors)}")
             else:
-                # Track validation errors using element object as key
-                self._validation_errors[element] = errors
+                # Keep the errors with the element instead of in the factory,
+                # so they are released together with the element
+                element.metadata.validation_errors.extend(errors)
 
         return element
 
@@ -120,14 +123,13 @@ class ElementFactory:
             ValueError: If required attributes are missing and auto_fill_defaults=False
         """
         attrs = attrs or {}
-        element_def = self.schema_info.elements.get(tag)
+        names = self._get_attr_names(tag)
 
-        if not element_def:
+        if names is None:
             raise ValueError(f"Element '{tag}' is not defined in schema")
 
         # Check for required attributes
-        required_attrs = [attr for attr in element_def.attributes if attr.required]
-        missing_attrs = [attr.name for attr in required_attrs if attr.name not in attrs]
+        missing_attrs = [name for name in names[0] if name not in attrs]
 
         if missing_attrs:
             if auto_fill_defaults:
@@ -168,11 +170,8 @@ class ElementFactory:
         Returns:
             List of required attribute names
         """
-        element_def = self.schema_info.elements.get(tag)
-        if not element_def:
-            return []
-
-        return [attr.name for attr in element_def.attributes if attr.required]
+        names = self._get_attr_names(tag)
+        return list(names[0]) if names else []
 
     def get_optional_attributes(self, tag: str) -> List[str]:
         """
@@ -184,11 +183,33 @@ class ElementFactory:
         Returns:
             List of optional attribute names
         """
-        element_def = self.schema_info.elements.get(tag)
-        if not element_def:
-            return []
+        names = self._get_attr_names(tag)
+        return list(names[1]) if names else []
+
+    def _get_attr_names(
+        self, tag: str
+    ) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """
+        Get the required and optional attribute names of an element.
 
-        return [attr.name for attr in element_def.attributes if not attr.required]
+        Args:
+            tag: Element tag name
+
+        Returns:
+            Tuple of (required names, optional names) in schema order, or
+            None if the element is not defined in the schema
+        """
+        names = self._attr_names.get(tag)
+        if names is None:
+            element_def = self.schema_info.elements.get(tag)
+            if not element_def:
+                return None
+            attributes = element_def.attributes
+            names = self._attr_names[tag] = (
+                tuple(attr.name for attr in attributes if attr.required),
+                tuple(attr.name for attr in attributes if not attr.required),
+            )
+        return names
 
     def get_all_attributes(self, tag: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -227,13 +248,10 @@ class ElementFactory:
             errors.append(f"Parent element '{parent_tag}' not defined in schema")
             return errors
 
-        # children is List[str] according to IElementDefinition
-        allowed_children = list(parent_def.children)
-
-        if child_tag not in allowed_children:
+        if child_tag not in parent_def.children_set:
             errors.append(
                 f"Element '{child_tag}' is not allowed as child of '{parent_tag}'. "
-                f"Allowed children: {', '.join(allowed_children)}"
+                f"Allowed children: {', '.join(parent_def.children)}"
             )
 
         return errors
@@ -246,9 +264,11 @@ class ElementFactory:
             element: Element to check
 
         Returns:
-            List of validation errors
+            Copy of the validation errors recorded in the element's metadata
         """
-        return self._validation_errors.get(element, [])
+        # Do not create metadata for elements that never had any
+        metadata = getattr(element, "_metadata", None)
+        return list(metadata.validation_errors) if metadata else []
 
     def get_element_info(self, tag: str) -> Optional[Dict[str, Any]]:
         """
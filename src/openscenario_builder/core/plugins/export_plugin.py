@@ -3,6 +3,7 @@ Export Plugin for OpenSCENARIO Builder
 Handles exporting scenarios to various formats
 """
 
+from functools import cached_property
 from typing import List
 import xml.etree.ElementTree
 
@@ -18,21 +19,9 @@ from openscenario_builder.interfaces import IExportPlugin, IElement
 class ExportPlugin(IExportPlugin):
     """Plugin for exporting scenarios to XML format"""
 
-    def __init__(self):
-        self._activated = True  # Default to activated
-
-    @property
-    def activated(self) -> bool:
-        """Whether this plugin is activated and should be loaded"""
-        return self._activated
-
-    @activated.setter
-    def activated(self, value: bool) -> None:
-        """Set the activation state of this plugin"""
-        self._activated = value
-
-    @property
+    @cached_property
     def metadata(self) -> PluginMetadata:
+        """Plugin metadata, built once per plugin instance"""
         return PluginMetadata(
             name="XML Export Plugin",
             version="1.0.0",
@@ -59,9 +48,14 @@ class ExportPlugin(IExportPlugin):
             print(f"Export failed: {e}")
             return False
 
+    @cached_property
+    def supported_formats(self) -> List[str]:
+        """Supported file extensions, built once per plugin instance"""
+        return [".xosc", ".xml"]
+
     def get_supported_formats(self) -> List[str]:
         """Return list of supported file extensions"""
-        return [".xosc", ".xml"]
+        return self.supported_formats
 
     def get_format_description(self, format_ext: str) -> str:
         """Return description for a specific format"""
@@ -76,7 +70,7 @@ class ExportPlugin(IExportPlugin):
         from xml.etree.ElementTree import Element
 
         # Create XML element with tag and attributes
-        xml_elem = Element(element.tag, element.attrs)
+        xml_elem = Element(element.tag, dict(element.attrs))
 
         # Add child elements recursively
         for child in element.children:
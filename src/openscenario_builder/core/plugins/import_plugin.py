@@ -3,7 +3,8 @@ Import Plugin for OpenSCENARIO Builder
 Handles importing scenarios from various formats
 """
 
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, List, Optional
 from xml.etree.ElementTree import Element as XMLElement, parse
 
 try:
@@ -12,6 +13,12 @@ except ImportError:
     # Fallback for when loaded directly by plugin manager
     from openscenario_builder.core.plugins.plugin_metadata import PluginMetadata
 
+try:
+    # lxml parses large scenarios considerably faster than xml.etree
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 from openscenario_builder.interfaces import IImportPlugin, IElement
 from openscenario_builder.core.model.element import Element
 
@@ -19,21 +26,9 @@ from openscenario_builder.core.model.element import Element
 class ImportPlugin(IImportPlugin):
     """Plugin for importing scenarios from XML format"""
 
-    def __init__(self):
-        self._activated = True  # Default to activated
-
-    @property
-    def activated(self) -> bool:
-        """Whether this plugin is activated and should be loaded"""
-        return self._activated
-
-    @activated.setter
-    def activated(self, value: bool) -> None:
-        """Set the activation state of this plugin"""
-        self._activated = value
-
-    @property
+    @cached_property
     def metadata(self) -> PluginMetadata:
+        """Plugin metadata, built once per plugin instance"""
         return PluginMetadata(
             name="XML Import Plugin",
             version="1.0.0",
@@ -47,8 +42,7 @@ class ImportPlugin(IImportPlugin):
         """Import scenario from XML file"""
         try:
             # Parse the XML file
-            tree = parse(file_path)
-            root_etree = tree.getroot()
+            root_etree = self._parse(file_path)
 
             # Convert XML ElementTree to custom Element
             root_element = self._xml_to_element(root_etree)
@@ -59,9 +53,14 @@ class ImportPlugin(IImportPlugin):
             print(f"Import failed: {e}")
             return None
 
+    @cached_property
+    def supported_formats(self) -> List[str]:
+        """Supported file extensions, built once per plugin instance"""
+        return [".xosc", ".xml"]
+
     def get_supported_formats(self) -> List[str]:
         """Return list of supported file extensions"""
-        return [".xosc", ".xml"]
+        return self.supported_formats
 
     def get_format_description(self, format_ext: str) -> str:
         """Return description for a specific format"""
@@ -71,6 +70,21 @@ class ImportPlugin(IImportPlugin):
             return "Standard XML format (.xml)"
         return f"Import from {format_ext.upper()} format"
 
+    def _parse(self, file_path: str) -> Any:
+        """Parse an XML file, preferring lxml when it is installed"""
+        if lxml_etree is None:
+            return parse(file_path).getroot()
+
+        # Drop comments and processing instructions like xml.etree does and
+        # never resolve entities or fetch external resources
+        parser = lxml_etree.XMLParser(
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        return lxml_etree.parse(file_path, parser).getroot()
+
     def _xml_to_element(self, xml_element: XMLElement) -> Element:
         """Convert XML ElementTree element to custom Element"""
         # Extract attributes
@@ -83,6 +97,9 @@ class ImportPlugin(IImportPlugin):
 
         # Process child elements recursively
         for child_xml in xml_element:
+            # Skip unresolved entity nodes lxml keeps in the tree
+            if not isinstance(child_xml.tag, str):
+                continue
             child_element = self._xml_to_element(child_xml)
             element.add_child(child_element)
 
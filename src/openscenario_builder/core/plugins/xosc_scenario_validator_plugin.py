@@ -10,8 +10,12 @@ This is a refactored version (v3.2.0) that delegates to specialized validators:
 - XoscUniquenessValidator: Name uniqueness constraints
 - XoscMinOccurValidator: Minimum occurrence constraints validation
 - XoscSequenceOrderValidator: Sequence order validation for sequence content models
+
+Schema structure, document structure, sequence order and uniqueness checks
+run through FusedXoscValidator so the element tree is walked once for all four.
 """
 
+from functools import cached_property
 from typing import List, Optional
 
 try:
@@ -27,6 +31,7 @@ from openscenario_builder.core.utils.validators import (
     XoscUniquenessValidator,
     XoscMinOccurValidator,
     XoscSequenceOrderValidator,
+    FusedXoscValidator,
 )
 
 from openscenario_builder.interfaces import IValidatorPlugin, IElement, ISchemaInfo
@@ -52,8 +57,6 @@ class XoscScenarioValidatorPlugin(IValidatorPlugin):
     """
 
     def __init__(self):
-        self._activated = True
-
         # Initialize specialized validators
         self._schema_validator = XoscSchemaStructureValidator()
         self._reference_validator = XoscReferenceValidator()
@@ -63,18 +66,12 @@ class XoscScenarioValidatorPlugin(IValidatorPlugin):
         self._min_occur_validator = XoscMinOccurValidator()
         self._sequence_order_validator = XoscSequenceOrderValidator()
 
-    @property
-    def activated(self) -> bool:
-        """Whether this plugin is activated and should be loaded"""
-        return self._activated
+        # Single-walk composite for the per-element validators
+        self._fused_validator = FusedXoscValidator()
 
-    @activated.setter
-    def activated(self, value: bool) -> None:
-        """Set the activation state of this plugin"""
-        self._activated = value
-
-    @property
+    @cached_property
     def metadata(self) -> PluginMetadata:
+        """Plugin metadata, built once per plugin instance"""
         return PluginMetadata(
             name="XOSC Scenario Comprehensive Validator",
             version="3.2.0",
@@ -111,14 +108,17 @@ class XoscScenarioValidatorPlugin(IValidatorPlugin):
         """
         errors = []
 
-        # Run all specialized validators in order
-        errors.extend(self._schema_validator.validate(element, schema_info))
-        errors.extend(self._structure_validator.validate(element, schema_info))
+        # Schema, structure, sequence order and uniqueness share one tree walk
+        fused = self._fused_validator.validate_by_validator(element, schema_info)
+
+        # Merge results in the documented validator order
+        errors.extend(fused[FusedXoscValidator.SCHEMA_STRUCTURE])
+        errors.extend(fused[FusedXoscValidator.STRUCTURE])
         errors.extend(self._min_occur_validator.validate(element, schema_info))
-        errors.extend(self._sequence_order_validator.validate(element, schema_info))
+        errors.extend(fused[FusedXoscValidator.SEQUENCE_ORDER])
         errors.extend(self._reference_validator.validate(element, schema_info))
         errors.extend(self._datatype_validator.validate(element, schema_info))
-        errors.extend(self._uniqueness_validator.validate(element, schema_info))
+        errors.extend(fused[FusedXoscValidator.UNIQUENESS])
 
         return errors
 
@@ -3,8 +3,9 @@ OpenSCENARIO Schema Parser
 Parses XSD files and maintains element hierarchy and relationships
 """
 
+import sys
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple, Mapping
+from typing import Dict, FrozenSet, List, Optional, Tuple, Mapping
 from pathlib import Path
 from openscenario_builder.interfaces import (
     IElementDefinition,
@@ -18,8 +19,11 @@ from openscenario_builder.interfaces import (
 class AttributeDefinition(IAttributeDefinition):
     """Concrete implementation of attribute definition"""
 
+    # Schemas hold thousands of these; avoid a __dict__ per instance
+    __slots__ = ("_name", "_type", "_required")
+
     def __init__(self, name: str, type: str, required: bool):
-        self._name = name
+        self._name = sys.intern(name)
         self._type = type
         self._required = required
 
@@ -35,10 +39,24 @@ class AttributeDefinition(IAttributeDefinition):
     def required(self) -> bool:
         return self._required
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AttributeDefinition):
+            return NotImplemented
+        return (self._name, self._type, self._required) == (
+            other._name,
+            other._type,
+            other._required,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._name, self._type, self._required))
+
 
 class ChildElementInfo(IChildElementInfo):
     """Information about a child element including occurrence constraints"""
 
+    __slots__ = ("_name", "_min_occur", "_max_occur")
+
     def __init__(self, name: str, min_occur: int = 1, max_occur: str = "1"):
         self._name = name
         self._min_occur = min_occur
@@ -56,10 +74,36 @@ class ChildElementInfo(IChildElementInfo):
     def max_occur(self) -> str:
         return self._max_occur
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChildElementInfo):
+            return NotImplemented
+        return (self._name, self._min_occur, self._max_occur) == (
+            other._name,
+            other._min_occur,
+            other._max_occur,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._name, self._min_occur, self._max_occur))
+
 
 class ElementDefinition(IElementDefinition):
     """Complete definition of an XML element"""
 
+    __slots__ = (
+        "_name",
+        "_attributes",
+        "_children",
+        "parent",
+        "_description",
+        "_is_abstract",
+        "_is_root",
+        "_child_occurrence_info",
+        "_content_model_type",
+        "_attr_names_set",
+        "_children_set",
+    )
+
     def __init__(
         self,
         name: str,
@@ -72,7 +116,7 @@ class ElementDefinition(IElementDefinition):
         child_occurrence_info: Optional[Dict[str, IChildElementInfo]] = None,
         content_model_type: str = "sequence",
     ):
-        self._name = name
+        self._name = sys.intern(name)
         self._attributes = attributes
         self._children = children
         self.parent = parent
@@ -81,6 +125,8 @@ class ElementDefinition(IElementDefinition):
         self._is_root = is_root
         self._child_occurrence_info = child_occurrence_info or {}
         self._content_model_type = content_model_type
+        self._attr_names_set = frozenset(attr.name for attr in attributes)
+        self._children_set = frozenset(children)
 
     @property
     def name(self) -> str:
@@ -90,10 +136,18 @@ class ElementDefinition(IElementDefinition):
     def attributes(self) -> List[IAttributeDefinition]:
         return self._attributes
 
+    @property
+    def attr_names_set(self) -> FrozenSet[str]:
+        return self._attr_names_set
+
     @property
     def children(self) -> List[str]:
         return self._children
 
+    @property
+    def children_set(self) -> FrozenSet[str]:
+        return self._children_set
+
     @property
     def is_abstract(self) -> bool:
         return self._is_abstract
@@ -126,6 +180,15 @@ class ElementDefinition(IElementDefinition):
 class GroupDefinition(IGroupDefinition):
     """Definition of an XSD group"""
 
+    __slots__ = (
+        "_name",
+        "_children",
+        "_is_choice",
+        "_is_sequence",
+        "_is_all",
+        "_child_occurrence_info",
+    )
+
     def __init__(
         self,
         name: str,
@@ -135,7 +198,7 @@ class GroupDefinition(IGroupDefinition):
         is_all: bool = False,
         child_occurrence_info: Optional[Dict[str, IChildElementInfo]] = None,
     ):
-        self._name = name
+        self._name = sys.intern(name)
         self._children = children
         self._is_choice = is_choice
         self._is_sequence = is_sequence
@@ -225,6 +288,7 @@ class XSDParser:
         # Parse elements and build hierarchy
         elements, root_elements = self._parse_elements(root, complex_types, groups)
         hierarchy = self._build_hierarchy(elements)
+        elements, groups = self._intern_names(elements, groups)
 
         return SchemaInfo(
             elements=elements,
@@ -234,6 +298,26 @@ class XSDParser:
             simple_type_definitions=simple_type_definitions,
         )
 
+    def _intern_names(
+        self,
+        elements: Dict[str, ElementDefinition],
+        groups: Dict[str, GroupDefinition],
+    ) -> Tuple[Dict[str, ElementDefinition], Dict[str, GroupDefinition]]:
+        """
+        Intern element and group names and child references so lookups with
+        interned element tags compare by identity
+        """
+        for definition in (*elements.values(), *groups.values()):
+            children = definition.children
+            children[:] = [sys.intern(child) for child in children]
+        for element_def in elements.values():
+            element_def._children_set = frozenset(element_def.children)
+
+        return (
+            {sys.intern(name): elem for name, elem in elements.items()},
+            {sys.intern(name): group for name, group in groups.items()},
+        )
+
     def _parse_simple_types(self, root: ET.Element) -> Dict[str, List[str]]:
         """Parse all simple type definitions)"""
         simple_type_definitions = {}
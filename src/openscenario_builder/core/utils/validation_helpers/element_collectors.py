@@ -3,9 +3,31 @@ Element collection utilities for XOSC validators
 Provides methods for collecting specific elements from the scenario tree
 """
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from openscenario_builder.interfaces import IElement
 
+# Tag -> (bucket, attribute holding the key) for collect_all
+_COLLECT_ALL_TARGETS: Dict[str, Tuple[str, str]] = {
+    **{
+        tag: ("entities", "name")
+        for tag in (
+            "ScenarioObject",
+            "EntityObject",
+            "Vehicle",
+            "Pedestrian",
+            "MiscObject",
+        )
+    },
+    "VariableDeclaration": ("variables", "name"),
+    "ParameterDeclaration": ("parameters", "name"),
+    **{
+        tag: ("storyboard_elements", "name")
+        for tag in ("Act", "ManeuverGroup", "Maneuver", "Event", "Action")
+    },
+    "TrafficSignalController": ("traffic_controllers", "name"),
+    "TrafficSignal": ("traffic_signals", "id"),
+}
+
 
 class ElementCollector:
     """Collection methods for gathering elements from the scenario tree"""
@@ -22,44 +44,83 @@ class ElementCollector:
         Returns:
             Dictionary mapping element names to elements
         """
-        collected = {}
-
-        def collect_recursive(elem: IElement):
-            if elem.tag in tags:
+        collected: Dict[str, IElement] = {}
+        tag_set = frozenset(tags)
+
+        # Walk in document order with an explicit stack so later elements
+        # still win on duplicate names and deep trees cannot hit the
+        # recursion limit
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            if elem.tag in tag_set:
                 name = elem.attrs.get("name")
                 if name:
                     collected[name] = elem
 
-            for child in elem.children:
-                collect_recursive(child)
+            children = elem.children
+            if children:
+                stack.extend(reversed(children))
 
-        collect_recursive(root)
         return collected
 
+    @staticmethod
+    def collect_all(root: IElement) -> Dict[str, Dict[str, IElement]]:
+        """
+        Collect every kind of declaration in a single walk of the tree
+
+        Args:
+            root: Root element to start collection from
+
+        Returns:
+            Dictionary with the buckets "entities", "variables", "parameters",
+            "storyboard_elements", "traffic_controllers" and "traffic_signals",
+            each mapping element names (signal ids for traffic signals) to
+            elements
+        """
+        buckets: Dict[str, Dict[str, IElement]] = {
+            bucket: {} for bucket, _ in _COLLECT_ALL_TARGETS.values()
+        }
+        targets = {
+            tag: (buckets[bucket], key)
+            for tag, (bucket, key) in _COLLECT_ALL_TARGETS.items()
+        }
+
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            target = targets.get(elem.tag)
+            if target is not None:
+                bucket, key = target
+                name = elem.attrs.get(key)
+                if name:
+                    bucket[name] = elem
+
+            children = elem.children
+            if children:
+                stack.extend(reversed(children))
+
+        return buckets
+
     @staticmethod
     def collect_entities(root: IElement) -> Dict[str, IElement]:
         """Collect all entity definitions in the scenario"""
-        return ElementCollector.collect_by_tags(
-            root,
-            ["ScenarioObject", "EntityObject", "Vehicle", "Pedestrian", "MiscObject"],
-        )
+        return ElementCollector.collect_all(root)["entities"]
 
     @staticmethod
     def collect_variables(root: IElement) -> Dict[str, IElement]:
         """Collect all variable declarations"""
-        return ElementCollector.collect_by_tags(root, ["VariableDeclaration"])
+        return ElementCollector.collect_all(root)["variables"]
 
     @staticmethod
     def collect_parameters(root: IElement) -> Dict[str, IElement]:
         """Collect all parameter declarations"""
-        return ElementCollector.collect_by_tags(root, ["ParameterDeclaration"])
+        return ElementCollector.collect_all(root)["parameters"]
 
     @staticmethod
     def collect_storyboard_elements(root: IElement) -> Dict[str, IElement]:
         """Collect all storyboard elements (Acts, Maneuvers, Events, etc.)"""
-        return ElementCollector.collect_by_tags(
-            root, ["Act", "ManeuverGroup", "Maneuver", "Event", "Action"]
-        )
+        return ElementCollector.collect_all(root)["storyboard_elements"]
 
     @staticmethod
     def collect_traffic_elements(
@@ -71,21 +132,5 @@ class ElementCollector:
         Returns:
             Tuple of (controllers, signals) dictionaries
         """
-        controllers = {}
-        signals = {}
-
-        def collect_recursive(elem: IElement):
-            if elem.tag == "TrafficSignalController":
-                name = elem.attrs.get("name")
-                if name:
-                    controllers[name] = elem
-            elif elem.tag == "TrafficSignal":
-                signal_id = elem.attrs.get("id")
-                if signal_id:
-                    signals[signal_id] = elem
-
-            for child in elem.children:
-                collect_recursive(child)
-
-        collect_recursive(root)
-        return controllers, signals
+        collected = ElementCollector.collect_all(root)
+        return collected["traffic_controllers"], collected["traffic_signals"]
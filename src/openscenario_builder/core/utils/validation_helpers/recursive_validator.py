@@ -26,14 +26,17 @@ class RecursiveValidator:
         Returns:
             List of validation errors
         """
-        errors = []
+        errors: List[str] = []
 
-        def validate_recursive(elem: IElement):
-            element_errors = validation_func(elem, *args, **kwargs)
-            errors.extend(element_errors)
+        # Visit in document order with an explicit stack so deep trees do
+        # not hit the recursion limit
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            errors.extend(validation_func(elem, *args, **kwargs))
 
-            for child in elem.children:
-                validate_recursive(child)
+            children = elem.children
+            if children:
+                stack.extend(reversed(children))
 
-        validate_recursive(root)
         return errors
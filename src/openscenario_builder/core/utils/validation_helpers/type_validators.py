@@ -3,10 +3,24 @@ Type validation utilities for XOSC validators
 Provides methods for validating attribute values against expected types
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from datetime import datetime
+from weakref import WeakKeyDictionary
 import re
-from openscenario_builder.interfaces import ISchemaInfo, IGroupDefinition
+from openscenario_builder.interfaces import ISchemaInfo
+
+# OpenSCENARIO parameter reference, compiled once; checked for every
+# attribute value starting with '$'
+_PARAMETER_PATTERN = re.compile(r"^\$[A-Za-z_][A-Za-z0-9_]*$")
+
+# Accepted spellings of a boolean, compared after lower()
+_BOOLEAN_VALUES = frozenset(("true", "false", "1", "0"))
+
+# Per-schema group expansions keyed by the unexpanded children
+_EXPANDED_CHILDREN: (
+    "WeakKeyDictionary[ISchemaInfo, Dict[Tuple[str, ...], Tuple[str, ...]]]"
+) = WeakKeyDictionary()
 
 
 class ValidationUtils:
@@ -40,14 +54,17 @@ class ValidationUtils:
         Returns:
             True if value matches parameter pattern, False otherwise
         """
-        pattern = r"^\$[A-Za-z_][A-Za-z0-9_]*$"
-        return bool(re.match(pattern, value))
+        return _PARAMETER_PATTERN.match(value) is not None
 
     @staticmethod
+    @lru_cache(maxsize=16384)
     def validate_attribute_type(value: str, expected_type: str) -> bool:
         """
         Validate attribute value against expected type
 
+        Results are cached: scenarios repeat the same literals across many
+        attributes, and the check is a pure function of its arguments.
+
         Args:
             value: The attribute value to validate
             expected_type: The expected data type (e.g., 'int', 'double', 'boolean')
@@ -78,7 +95,7 @@ class ValidationUtils:
                 float(value)
                 return True
             elif expected_type == "boolean":
-                return value.lower() in ("true", "false", "1", "0")
+                return value.lower() in _BOOLEAN_VALUES
             elif expected_type == "dateTime":
                 # Handle ISO format dates with or without timezone
                 date_value = value
@@ -121,6 +138,9 @@ class ValidationUtils:
         """
         Expand group references to get all valid child element names
 
+        Expansions are cached per schema, so the groups of a schema must not
+        change once it has been used for validation.
+
         Args:
             children: List of child element names or group references
             schema_info: Schema information containing group definitions
@@ -128,53 +148,55 @@ class ValidationUtils:
         Returns:
             Expanded list of element names
         """
-        expanded_children = []
-
-        for child in children:
-            if child.startswith("GROUP:"):
-                group_name = child[6:]  # Remove "GROUP:" prefix
-                group_def = schema_info.groups.get(group_name)
-                if group_def:
-                    expanded_children.extend(
-                        ValidationUtils._expand_group_recursively(
-                            group_def, schema_info
-                        )
-                    )
-                else:
-                    # Group not found, keep the reference for error reporting
-                    expanded_children.append(child)
-            else:
-                expanded_children.append(child)
+        cache = _EXPANDED_CHILDREN.get(schema_info)
+        if cache is None:
+            cache = _EXPANDED_CHILDREN[schema_info] = {}
 
-        return expanded_children
+        key = tuple(children)
+        expanded = cache.get(key)
+        if expanded is None:
+            expanded = cache[key] = ValidationUtils._expand_groups(key, schema_info)
+        return list(expanded)
 
     @staticmethod
-    def _expand_group_recursively(
-        group_def: IGroupDefinition, schema_info: ISchemaInfo
-    ) -> List[str]:
-        """
-        Recursively expand a group definition to get all valid element names
+    def _expand_groups(
+        children: Tuple[str, ...], schema_info: ISchemaInfo
+    ) -> Tuple[str, ...]:
+        """Expand group references without consulting the cache"""
+        expanded_children: List[str] = []
+        groups = schema_info.groups
+
+        # Each entry is (children iterator, group on path); unresolved group
+        # references are only kept at the top level
+        stack = [(iter(children), None)]
+        active = set()
+
+        while stack:
+            child_iter, group_id = stack[-1]
+            child = next(child_iter, None)
+
+            if child is None:
+                stack.pop()
+                active.discard(group_id)
+                continue
+
+            if not child.startswith("GROUP:"):
+                expanded_children.append(child)
+                continue
 
-        Args:
-            group_def: Group definition to expand
-            schema_info: Schema information
+            group_def = groups.get(child[6:])  # Remove "GROUP:" prefix
+            if group_def is None:
+                if group_id is None:
+                    # Group not found, keep the reference for error reporting
+                    expanded_children.append(child)
+                continue
 
-        Returns:
-            List of element names in the group
-        """
-        elements = []
-
-        for child in group_def.children:
-            if child.startswith("GROUP:"):
-                nested_group_name = child[6:]
-                nested_group_def = schema_info.groups.get(nested_group_name)
-                if nested_group_def:
-                    elements.extend(
-                        ValidationUtils._expand_group_recursively(
-                            nested_group_def, schema_info
-                        )
-                    )
-            else:
-                elements.append(child)
+            nested_id = id(group_def)
+            if nested_id in active:
+                # Cyclic group reference
+                continue
+
+            active.add(nested_id)
+            stack.append((iter(group_def.children), nested_id))
 
-        return elements
+        return tuple(expanded_children)
@@ -10,6 +10,8 @@ from .structure_validator import XoscStructureValidator
 from .uniqueness_validator import XoscUniquenessValidator
 from .min_occur_validator import XoscMinOccurValidator
 from .sequence_order_validator import XoscSequenceOrderValidator
+from .fused_validator import FusedXoscValidator
+from .schema_validator_compiler import SchemaValidatorCompiler
 
 __all__ = [
     "XoscSchemaStructureValidator",
@@ -19,4 +21,6 @@ __all__ = [
     "XoscUniquenessValidator",
     "XoscMinOccurValidator",
     "XoscSequenceOrderValidator",
+    "FusedXoscValidator",
+    "SchemaValidatorCompiler",
 ]
@@ -0,0 +1,160 @@
+"""
+XOSC Fused Validator
+Runs the per-element checks of several validators in a single tree walk
+"""
+
+from typing import Dict, List, Optional
+
+from openscenario_builder.interfaces import IElement, ISchemaInfo
+
+from .schema_structure_validator import XoscSchemaStructureValidator
+from .schema_validator_compiler import SchemaValidatorCompiler
+from .sequence_order_validator import XoscSequenceOrderValidator
+from .structure_validator import XoscStructureValidator
+from .uniqueness_validator import XoscUniquenessValidator
+
+
+class FusedXoscValidator:
+    """
+    Composite validator that fuses schema structure, document structure,
+    sequence order and uniqueness validation into one depth-first walk
+
+    Errors are collected per validator and returned in the same order the
+    individual validators would have produced them.
+    """
+
+    SCHEMA_STRUCTURE = "schema_structure"
+    STRUCTURE = "structure"
+    SEQUENCE_ORDER = "sequence_order"
+    UNIQUENESS = "uniqueness"
+
+    VALIDATOR_ORDER = (SCHEMA_STRUCTURE, STRUCTURE, SEQUENCE_ORDER, UNIQUENESS)
+
+    def __init__(self):
+        self._schema_validator = XoscSchemaStructureValidator()
+        self._structure_validator = XoscStructureValidator()
+        self._sequence_order_validator = XoscSequenceOrderValidator()
+        self._uniqueness_validator = XoscUniquenessValidator()
+
+    def validate(
+        self, element: IElement, schema_info: Optional[ISchemaInfo] = None
+    ) -> List[str]:
+        """
+        Validate the element tree with all fused validators
+
+        Args:
+            element: Root element to validate
+            schema_info: Schema information for validation
+
+        Returns:
+            List of validation error messages
+        """
+        results = self.validate_by_validator(element, schema_info)
+        errors = []
+        for name in self.VALIDATOR_ORDER:
+            errors.extend(results[name])
+        return errors
+
+    def validate_by_validator(
+        self, element: IElement, schema_info: Optional[ISchemaInfo] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Validate the element tree and return errors keyed by validator name
+
+        Args:
+            element: Root element to validate
+            schema_info: Schema information for validation
+
+        Returns:
+            Dictionary mapping validator name to its validation errors
+        """
+        results = self._validate_document(element, schema_info)
+        self._walk(element, schema_info, schema_info is not None, results)
+        return results
+
+    def _validate_document(
+        self, element: IElement, schema_info: Optional[ISchemaInfo]
+    ) -> Dict[str, List[str]]:
+        """Create the result buckets and run the document-level checks"""
+        results: Dict[str, List[str]] = {name: [] for name in self.VALIDATOR_ORDER}
+
+        # Document structure requirements only apply to the root element
+        results[self.STRUCTURE].extend(
+            self._structure_validator.validate(element, schema_info)
+        )
+
+        if schema_info is None:
+            # Schema-based validators report a configuration error instead
+            results[self.SCHEMA_STRUCTURE].extend(
+                self._schema_validator.validate(element, None)
+            )
+            results[self.SEQUENCE_ORDER].extend(
+                self._sequence_order_validator.validate(element, None)
+            )
+
+        return results
+
+    def _visit_node(
+        self,
+        node: IElement,
+        schema_info: Optional[ISchemaInfo],
+        check_schema: bool,
+        results: Dict[str, List[str]],
+    ) -> bool:
+        """
+        Run the per-element checks on a single element
+
+        Args:
+            node: Element to check
+            schema_info: Schema information for validation
+            check_schema: Whether schema structure checks apply to this element
+            results: Result buckets to append to
+
+        Returns:
+            Whether schema structure checks apply to the element's children
+        """
+        if check_schema:
+            check = SchemaValidatorCompiler.compile(schema_info).get(node.tag)
+            if check is None:
+                # Schema checks stop below an unknown element
+                results[self.SCHEMA_STRUCTURE].append(
+                    self._schema_validator.unknown_element_error(node)
+                )
+                check_schema = False
+            else:
+                results[self.SCHEMA_STRUCTURE].extend(check(node))
+        if schema_info is not None:
+            results[self.SEQUENCE_ORDER].extend(
+                self._sequence_order_validator.validate_node(node, schema_info)
+            )
+        results[self.UNIQUENESS].extend(self._uniqueness_validator.validate_node(node))
+        return check_schema
+
+    def _walk(
+        self,
+        element: IElement,
+        schema_info: Optional[ISchemaInfo],
+        check_schema: bool,
+        results: Dict[str, List[str]],
+    ) -> None:
+        """
+        Check an element and all its descendants in document order
+
+        Args:
+            element: Root of the subtree to check
+            schema_info: Schema information for validation
+            check_schema: Whether schema structure checks apply to the root
+            results: Result buckets to append to
+        """
+        visit = self._visit_node
+
+        # Iterative pre-order walk, children pushed in reverse to keep
+        # document order. Each entry carries whether schema checks still
+        # apply to it.
+        stack = [(element, check_schema)]
+        pop = stack.pop
+        push_all = stack.extend
+        while stack:
+            node, check_schema = pop()
+            check_schema = visit(node, schema_info, check_schema, results)
+            push_all([(child, check_schema) for child in reversed(node.children)])
@@ -10,6 +10,9 @@ from openscenario_builder.core.utils.validation_helpers import ElementCollector
 
 from openscenario_builder.interfaces import IElement, ISchemaInfo
 
+# Parameter references inside an expression: $ followed by an identifier
+_EXPRESSION_PARAMETER_PATTERN = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+
 
 class XoscReferenceValidator:
     """Validates that all references can be resolved to their declarations"""
@@ -33,11 +36,7 @@ class XoscReferenceValidator:
         content = expression[2:-1]
 
         # Find all parameter references ($ followed by identifier characters)
-        # Pattern matches: $ followed by one or more alphanumeric or underscore characters
-        param_pattern = r"\$([A-Za-z_][A-Za-z0-9_]*)"
-        matches = re.findall(param_pattern, content)
-
-        return matches
+        return _EXPRESSION_PARAMETER_PATTERN.findall(content)
 
     def validate(
         self, element: IElement, schema_info: Optional[ISchemaInfo] = None
@@ -54,20 +53,29 @@ class XoscReferenceValidator:
         """
         errors = []
 
-        # Collect all declarations
-        entities = ElementCollector.collect_entities(element)
-        variables = ElementCollector.collect_variables(element)
-        parameters = ElementCollector.collect_parameters(element)
-        storyboard_elements = ElementCollector.collect_storyboard_elements(element)
+        # Collect all declarations in one pass over the tree
+        collected = ElementCollector.collect_all(element)
 
         # Validate references
-        errors.extend(self._validate_entity_references(element, entities))
-        errors.extend(self._validate_variable_references(element, variables))
-        errors.extend(self._validate_parameter_references(element, parameters))
+        errors.extend(self._validate_entity_references(element, collected["entities"]))
+        errors.extend(
+            self._validate_variable_references(element, collected["variables"])
+        )
+        errors.extend(
+            self._validate_parameter_references(element, collected["parameters"])
+        )
+        errors.extend(
+            self._validate_storyboard_element_references(
+                element, collected["storyboard_elements"]
+            )
+        )
         errors.extend(
-            self._validate_storyboard_element_references(element, storyboard_elements)
+            self._validate_traffic_signal_references(
+                element,
+                collected["traffic_controllers"],
+                collected["traffic_signals"],
+            )
         )
-        errors.extend(self._validate_traffic_signal_references(element))
 
         return errors
 
@@ -265,21 +273,25 @@ class XoscReferenceValidator:
         validate_recursive(element)
         return errors
 
-    def _validate_traffic_signal_references(self, element: IElement) -> List[str]:
+    def _validate_traffic_signal_references(
+        self,
+        element: IElement,
+        controllers: Dict[str, IElement],
+        signals: Dict[str, IElement],
+    ) -> List[str]:
         """
         Validate traffic signal controller and signal ID references
 
         Args:
             element: Root element
+            controllers: Dictionary of traffic signal controllers
+            signals: Dictionary of traffic signals by id
 
         Returns:
             List of validation errors
         """
         errors = []
 
-        # Collect traffic signal controllers and signals
-        controllers, signals = ElementCollector.collect_traffic_elements(element)
-
         def validate_traffic_refs(elem: IElement):
             if elem.tag == "TrafficSignalStateAction":
                 if "trafficSignalControllerRef" in elem.attrs:
@@ -0,0 +1,224 @@
+"""
+XOSC Schema Validator Compiler
+Builds specialized per-element validation functions from schema definitions
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+from weakref import WeakKeyDictionary
+
+from openscenario_builder.core.utils.validation_helpers import ValidationUtils
+
+from openscenario_builder.interfaces import IElement, IElementDefinition, ISchemaInfo
+
+# Validation function for a single element of a known definition
+ElementCheck = Callable[[IElement], List[str]]
+
+# Check op: an opcode followed by the values the check needs
+Op = Tuple[Any, ...]
+
+# Opcodes of the compiled check ops
+OP_UNKNOWN_ATTRIBUTES = 0  # (op, valid attribute names, joined names)
+OP_ATTRIBUTE = 1  # (op, name, type, required, type hint, enumerated values)
+OP_CHILDREN = 2  # (op, valid child names, joined names)
+
+# Lower-cased simple type name -> (valid values as a set, joined valid values)
+SimpleTypeIndex = Dict[str, Tuple[FrozenSet[str], str]]
+
+# Per-schema index of simple type definitions, built on first use
+_SIMPLE_TYPE_INDEX: "WeakKeyDictionary[ISchemaInfo, SimpleTypeIndex]" = (
+    WeakKeyDictionary()
+)
+
+# Per-schema compiled element checks keyed by element name
+_COMPILED: "WeakKeyDictionary[ISchemaInfo, Dict[str, ElementCheck]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_simple_type_index(schema_info: ISchemaInfo) -> SimpleTypeIndex:
+    """Get the case-insensitive simple type index for a schema"""
+    index = _SIMPLE_TYPE_INDEX.get(schema_info)
+    if index is None:
+        index = {}
+        for key, values in schema_info.simple_type_definitions.items():
+            # Keep the first match, as the previous linear lookup did
+            index.setdefault(key.lower(), (frozenset(values), ", ".join(values)))
+        _SIMPLE_TYPE_INDEX[schema_info] = index
+    return index
+
+
+class SchemaValidatorCompiler:
+    """
+    Compiles element definitions into specialized validation functions
+
+    Each definition is first compiled into a flat tuple of check ops holding
+    the valid attribute names, per-attribute checks, enumerated values and
+    valid children, which the returned function runs in order. Validating an
+    element therefore no longer consults the schema at all. Compiled
+    functions are cached per schema and built on first use, which assumes
+    the schema is not modified once validation has started.
+    """
+
+    @staticmethod
+    def compile(schema_info: ISchemaInfo) -> Dict[str, ElementCheck]:
+        """
+        Get the compiled validation functions for a schema
+
+        Args:
+            schema_info: Schema information to compile
+
+        Returns:
+            Dictionary mapping element name to its validation function
+        """
+        compiled = _COMPILED.get(schema_info)
+        if compiled is None:
+            compiled = {
+                name: SchemaValidatorCompiler.compile_element(element_def, schema_info)
+                for name, element_def in schema_info.elements.items()
+            }
+            _COMPILED[schema_info] = compiled
+        return compiled
+
+    @staticmethod
+    def compile_ops(
+        element_def: IElementDefinition, schema_info: ISchemaInfo
+    ) -> Tuple[Op, ...]:
+        """
+        Compile a single element definition into a flat list of check ops
+
+        Each op is a tuple whose first entry is an opcode and whose remaining
+        entries are the values the check needs. Ops are emitted in the order
+        errors are reported: unknown attributes, one op per defined
+        attribute, then the allowed children.
+
+        Args:
+            element_def: Element definition to compile
+            schema_info: Schema information used to resolve groups and types
+
+        Returns:
+            Tuple of check ops for the definition
+        """
+        simple_types = _get_simple_type_index(schema_info)
+        ops: List[Op] = [
+            (
+                OP_UNKNOWN_ATTRIBUTES,
+                element_def.attr_names_set,
+                ", ".join(attr.name for attr in element_def.attributes),
+            )
+        ]
+
+        for attr in element_def.attributes:
+            ops.append(
+                (
+                    OP_ATTRIBUTE,
+                    attr.name,
+                    attr.type,
+                    attr.required,
+                    ValidationUtils.get_type_validation_hint(attr.type),
+                    simple_types.get(attr.name.lower()),
+                )
+            )
+
+        children = ValidationUtils.expand_children_with_groups(
+            element_def.children, schema_info
+        )
+        ops.append((OP_CHILDREN, frozenset(children), ", ".join(children)))
+
+        return tuple(ops)
+
+    @staticmethod
+    def compile_element(
+        element_def: IElementDefinition, schema_info: ISchemaInfo
+    ) -> ElementCheck:
+        """
+        Compile a single element definition into a validation function
+
+        The function runs the definition's check ops (see compile_ops):
+        unknown, required, type and enumerated value checks for attributes,
+        followed by the allowed children.
+
+        Args:
+            element_def: Element definition to compile
+            schema_info: Schema information used to resolve groups and types
+
+        Returns:
+            Function validating one element against the definition
+        """
+        tag = element_def.name
+        ops = SchemaValidatorCompiler.compile_ops(element_def, schema_info)
+        is_valid_value = ValidationUtils.is_valid_attribute_value
+        validate_type = ValidationUtils.validate_attribute_type
+
+        def check(element: IElement) -> List[str]:
+            errors: List[str] = []
+            append = errors.append
+            attrs = element.attrs
+
+            for op in ops:
+                opcode = op[0]
+
+                if opcode == OP_ATTRIBUTE:
+                    # Validate the attribute value and check if it is required
+                    _, attr_name, attr_type, required, hint, simple_type = op
+                    attr_value = attrs.get(attr_name) or ""
+                    valid = is_valid_value(attr_value)
+
+                    if required and not valid:
+                        append(
+                            f"REQUIRED_ATTRIBUTE_ERROR: Required attribute '{attr_name}' is missing, "
+                            f"empty, or contains only whitespace for element '{tag}'. "
+                            f"Expected type: {attr_type}. "
+                            f"Fix: Add '{attr_name}=\"[appropriate_value]\"' to the '{tag}' element."
+                        )
+                        continue
+
+                    if not valid:
+                        continue
+
+                    # Skip parameter references for type validation; a valid
+                    # value is never empty
+                    if attr_value[0] == "$":
+                        continue
+
+                    if not validate_type(attr_value, attr_type):
+                        append(
+                            f"TYPE_ERROR: Invalid type for attribute '{attr_name}' in element '{tag}': "
+                            f"expected {attr_type}, got '{attr_value}'. "
+                            f"Fix: {hint}"
+                        )
+
+                    # Validate against enumerated values if defined
+                    if simple_type and attr_value not in simple_type[0]:
+                        append(
+                            f"VALUE_ERROR: Invalid value '{attr_value}' for attribute '{attr_name}' "
+                            f"in element '{tag}'. "
+                            f"Valid values: {simple_type[1]}. "
+                            f"Fix: Replace '{attr_value}' with one of the valid values."
+                        )
+
+                elif opcode == OP_UNKNOWN_ATTRIBUTES:
+                    # Check for unknown attributes
+                    valid_attrs = op[1]
+                    for attr_name in attrs:
+                        if attr_name not in valid_attrs:
+                            append(
+                                f"ATTRIBUTE_ERROR: Unknown attribute '{attr_name}' for element '{tag}'. "
+                                f"Valid attributes for '{tag}': {op[2]}. "
+                                f"Fix: Remove '{attr_name}' or replace with a valid attribute name."
+                            )
+
+                else:
+                    # Validate children structure
+                    valid_children = op[1]
+                    for child in element.children:
+                        child_tag = child.tag
+                        if child_tag not in valid_children:
+                            append(
+                                f"STRUCTURE_ERROR: Child element '{child_tag}' is not allowed in '{tag}'. "
+                                f"Valid child elements for '{tag}': {op[2]}. "
+                                f"Fix: Remove '{child_tag}' or replace with a valid child element."
+                            )
+
+            return errors
+
+        return check
@@ -3,9 +3,22 @@ XOSC Sequence Order Validator
 Validates that child elements in sequence content models appear in the correct order
 """
 
-from typing import List, Optional, Dict
+from bisect import bisect_left
+from itertools import islice
+from typing import List, Optional, Dict, Tuple
+from weakref import WeakKeyDictionary
+
 from openscenario_builder.interfaces import IElement, ISchemaInfo, IElementDefinition
 
+# Expanded sequence, element name -> sorted positions, the de-duplicated
+# sequence joined for error messages, and the suggestions per last position
+SequenceIndex = Tuple[List[str], Dict[str, List[int]], str, Dict[int, str]]
+
+# Per-schema sequence lookups keyed by element name, built on first use
+_SEQUENCE_INDEX: "WeakKeyDictionary[ISchemaInfo, Dict[str, SequenceIndex]]" = (
+    WeakKeyDictionary()
+)
+
 
 class XoscSequenceOrderValidator:
     """Validates element order for sequence content models"""
@@ -39,13 +52,30 @@ class XoscSequenceOrderValidator:
         """Recursively validate element and children for sequence order"""
 
         # Validate current element's children order
-        element_def = schema_info.elements.get(element.tag)
-        if element_def and element_def.content_model_type == "sequence":
-            self._validate_sequence_order(element, element_def, schema_info, errors)
+        errors.extend(self.validate_node(element, schema_info))
 
         # Recursively validate children
+        validate_child = self._validate_element_recursively
         for child in element.children:
-            self._validate_element_recursively(child, schema_info, errors)
+            validate_child(child, schema_info, errors)
+
+    def validate_node(self, element: IElement, schema_info: ISchemaInfo) -> List[str]:
+        """
+        Validate the children order of a single element without descending
+        into its children
+
+        Args:
+            element: Element whose children order is checked
+            schema_info: Schema information for validation
+
+        Returns:
+            List of validation error messages
+        """
+        errors: List[str] = []
+        element_def = schema_info.elements.get(element.tag)
+        if element_def and element_def.content_model_type == "sequence":
+            self._validate_sequence_order(element, element_def, schema_info, errors)
+        return errors
 
     def _validate_sequence_order(
         self,
@@ -56,27 +86,24 @@ class XoscSequenceOrderValidator:
     ) -> None:
         """Validate that children appear in the order defined by the sequence"""
 
-        if not element.children:
+        children = element.children
+        if not children:
             return
 
-        # Get the expected sequence order from schema
-        expected_sequence = self._expand_sequence_with_groups(
-            element_def.children, schema_info
+        # Get the expected sequence order and position map from schema
+        expected_sequence, expected_positions, sequence_str, suggestions = (
+            self._get_sequence_index(element_def, schema_info)
         )
 
         if not expected_sequence:
             return
 
-        # Build position map: element_name -> list of positions in expected sequence
-        expected_positions = self._build_position_map(expected_sequence)
-
         last_position = -1
+        get_positions = expected_positions.get
 
-        for idx, child in enumerate(element.children):
-            child_tag = child.tag
-
+        for child in children:
             # Get expected positions for this element type
-            valid_positions = expected_positions.get(child_tag, [])
+            valid_positions = get_positions(child.tag)
 
             if not valid_positions:
                 # Element not in sequence (handled by structure validator)
@@ -84,20 +111,43 @@ class XoscSequenceOrderValidator:
 
             # Find the earliest valid position that's at or after last_position
             # Using >= allows elements to repeat at the same position
-            next_valid_position = None
-            for pos in valid_positions:
-                if pos >= last_position:
-                    next_valid_position = pos
-                    break
+            i = bisect_left(valid_positions, last_position)
 
-            if next_valid_position is None:
+            if i == len(valid_positions):
                 # This element appears out of order
                 error_msg = self._generate_order_error(
-                    element, child, expected_sequence, idx, last_position
+                    element,
+                    child,
+                    expected_sequence,
+                    sequence_str,
+                    suggestions,
+                    last_position,
                 )
                 errors.append(error_msg)
             else:
-                last_position = next_valid_position
+                last_position = valid_positions[i]
+
+    def _get_sequence_index(
+        self, element_def: IElementDefinition, schema_info: ISchemaInfo
+    ) -> SequenceIndex:
+        """Get the cached expanded sequence and position map for an element"""
+        schema_index = _SEQUENCE_INDEX.get(schema_info)
+        if schema_index is None:
+            schema_index = _SEQUENCE_INDEX[schema_info] = {}
+
+        index = schema_index.get(element_def.name)
+        if index is None:
+            expected_sequence = self._expand_sequence_with_groups(
+                element_def.children, schema_info
+            )
+            index = (
+                expected_sequence,
+                self._build_position_map(expected_sequence),
+                " → ".join(dict.fromkeys(expected_sequence)),
+                {},
+            )
+            schema_index[element_def.name] = index
+        return index
 
     def _expand_sequence_with_groups(
         self, children: List[str], schema_info: ISchemaInfo
@@ -106,62 +156,64 @@ class XoscSequenceOrderValidator:
         Expand group references to get flat sequence of element names
         Preserves order and allows for multiple occurrences
         """
-        expanded = []
-
-        for child in children:
-            if child.startswith("GROUP:"):
-                group_name = child[6:]
-                group_def = schema_info.groups.get(group_name)
-
-                if group_def:
-                    if group_def.is_choice:
-                        # For choice groups, all options can appear at this position
-                        expanded.extend(
-                            self._expand_choice_group(group_def, schema_info)
-                        )
-                    else:
-                        # For sequence/all groups, expand recursively
-                        expanded.extend(
-                            self._expand_sequence_with_groups(
-                                group_def.children, schema_info
-                            )
-                        )
-                else:
-                    # Group not found, keep reference for error handling
-                    expanded.append(child)
-            else:
-                expanded.append(child)
-
-        return expanded
+        return self._expand_group_children(children, schema_info, is_choice=False)
 
     def _expand_choice_group(self, group_def, schema_info: ISchemaInfo) -> List[str]:
         """
         Expand a choice group - all choices can appear at same position
         Returns all possible element names from the choice group
         """
-        choices = []
-
-        for child in group_def.children:
-            if child.startswith("GROUP:"):
-                nested_group_name = child[6:]
-                nested_group = schema_info.groups.get(nested_group_name)
-                if nested_group:
-                    if nested_group.is_choice:
-                        # Recursively expand nested choice groups
-                        choices.extend(
-                            self._expand_choice_group(nested_group, schema_info)
-                        )
-                    else:
-                        # For non-choice nested groups, get all elements
-                        choices.extend(
-                            self._expand_sequence_with_groups(
-                                nested_group.children, schema_info
-                            )
-                        )
-            else:
-                choices.append(child)
+        return self._expand_group_children(
+            group_def.children, schema_info, is_choice=True
+        )
+
+    def _expand_group_children(
+        self, children: List[str], schema_info: ISchemaInfo, is_choice: bool
+    ) -> List[str]:
+        """
+        Iteratively expand group references in document order
 
-        return choices
+        Choice and sequence/all groups both contribute all of their elements.
+        Unresolved group references are kept in sequences for error handling
+        and dropped inside choice groups. A group that references itself,
+        directly or through nested groups, is not expanded again.
+        """
+        expanded: List[str] = []
+        groups = schema_info.groups
+
+        # Each entry is (children iterator, in choice group, group on path)
+        stack = [(iter(children), is_choice, None)]
+        active = set()
+
+        while stack:
+            child_iter, in_choice, group_id = stack[-1]
+            child = next(child_iter, None)
+
+            if child is None:
+                stack.pop()
+                active.discard(group_id)
+                continue
+
+            if not child.startswith("GROUP:"):
+                expanded.append(child)
+                continue
+
+            group_def = groups.get(child[6:])
+            if group_def is None:
+                if not in_choice:
+                    # Group not found, keep reference for error handling
+                    expanded.append(child)
+                continue
+
+            nested_id = id(group_def)
+            if nested_id in active:
+                # Cyclic group reference
+                continue
+
+            active.add(nested_id)
+            stack.append((iter(group_def.children), group_def.is_choice, nested_id))
+
+        return expanded
 
     def _build_position_map(self, sequence: List[str]) -> Dict[str, List[int]]:
         """
@@ -182,34 +234,32 @@ class XoscSequenceOrderValidator:
         parent: IElement,
         child: IElement,
         expected_sequence: List[str],
-        child_index: int,
+        sequence_str: str,
+        suggestions: Dict[int, str],
         last_position: int,
     ) -> str:
         """Generate detailed error message for sequence order violation"""
 
-        # Find what elements should come at or after this position
-        expected_at_position = []
-        seen_elements = set()
-
-        for pos, elem in enumerate(expected_sequence):
-            if pos > last_position:
-                if elem not in seen_elements:
-                    expected_at_position.append(elem)
-                    seen_elements.add(elem)
-                if len(expected_at_position) >= 5:  # Limit suggestions
-                    break
-
-        # Build a helpful error message
-        if expected_at_position:
-            expected_str = ", ".join(expected_at_position)
-        else:
-            expected_str = "elements that haven't appeared yet"
+        # Find what elements should come after this position, memoized per
+        # position since the sequence is fixed for the element definition
+        expected_str = suggestions.get(last_position)
+        if expected_str is None:
+            expected_at_position = list(
+                islice(dict.fromkeys(expected_sequence[last_position + 1 :]), 5)
+            )
+
+            # Build a helpful error message
+            if expected_at_position:
+                expected_str = ", ".join(expected_at_position)
+            else:
+                expected_str = "elements that haven't appeared yet"
+            suggestions[last_position] = expected_str
 
         return (
             f"SEQUENCE_ORDER_ERROR: Element '{child.tag}' appears out of sequence order "
             f"in parent element '{parent.tag}'. "
             f"This element should appear earlier in the sequence. "
-            f"Expected sequence: {' → '.join(list(dict.fromkeys(expected_sequence)))}. "
+            f"Expected sequence: {sequence_str}. "
             f"At current position, expected one of: {expected_str}. "
             f"Fix: Reorder the elements in '{parent.tag}' to match the required sequence."
         )
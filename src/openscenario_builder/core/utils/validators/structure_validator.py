@@ -7,6 +7,9 @@ from typing import List, Optional
 
 from openscenario_builder.interfaces import IElement, ISchemaInfo
 
+# Attributes every FileHeader must define
+_FH_REQUIRED = ("revMajor", "revMinor", "date", "description")
+
 
 class XoscStructureValidator:
     """Validates basic OpenSCENARIO document structure requirements"""
@@ -41,7 +44,7 @@ class XoscStructureValidator:
         errors = []
 
         # Check if this is the root OpenSCENARIO element
-        if element.tag in ["OpenSCENARIO", "OpenScenario"]:
+        if element.tag in ("OpenSCENARIO", "OpenScenario"):
             errors.extend(self._validate_root_element(element))
 
         return errors
@@ -58,30 +61,29 @@ class XoscStructureValidator:
         """
         errors = []
 
-        # Check for required FileHeader
-        fileheader_found = False
-        for child in element.children:
-            if child.tag == "FileHeader":
-                fileheader_found = True
-                errors.extend(self._validate_file_header(child))
-                break
-
-        if not fileheader_found:
-            errors.append(
-                "STRUCTURE_ERROR: FileHeader element is required in OpenSCENARIO. "
-                "Fix: Add a FileHeader element as the first child of OpenSCENARIO."
-            )
-
-        # Check for major structural elements
+        # Check for required FileHeader and major structural elements in one pass
+        fileheader = None
         has_catalog_or_roadnetwork_or_entities = False
         has_storyboard = False
 
         for child in element.children:
-            if child.tag in ["CatalogLocations", "RoadNetwork", "Entities"]:
+            tag = child.tag
+            if tag == "FileHeader":
+                if fileheader is None:
+                    fileheader = child
+            elif tag in ("CatalogLocations", "RoadNetwork", "Entities"):
                 has_catalog_or_roadnetwork_or_entities = True
-            elif child.tag == "Storyboard":
+            elif tag == "Storyboard":
                 has_storyboard = True
 
+        if fileheader is not None:
+            errors.extend(self._validate_file_header(fileheader))
+        else:
+            errors.append(
+                "STRUCTURE_ERROR: FileHeader element is required in OpenSCENARIO. "
+                "Fix: Add a FileHeader element as the first child of OpenSCENARIO."
+            )
+
         # Optionally warn about missing common elements (not errors, but good practice)
         if not has_catalog_or_roadnetwork_or_entities:
             # This is informational, not an error
@@ -103,15 +105,11 @@ class XoscStructureValidator:
         Returns:
             List of validation errors
         """
-        errors = []
-
         # Check for required attributes
-        required_attrs = ["revMajor", "revMinor", "date", "description"]
-        for attr in required_attrs:
-            if attr not in fileheader.attrs or not fileheader.attrs[attr]:
-                errors.append(
-                    f"STRUCTURE_ERROR: FileHeader is missing required attribute '{attr}'. "
-                    f"Fix: Add '{attr}' attribute to FileHeader element."
-                )
-
-        return errors
+        attrs = fileheader.attrs
+        return [
+            f"STRUCTURE_ERROR: FileHeader is missing required attribute '{attr}'. "
+            f"Fix: Add '{attr}' attribute to FileHeader element."
+            for attr in _FH_REQUIRED
+            if not attrs.get(attr)
+        ]
@@ -40,27 +40,10 @@ class XoscUniquenessValidator:
         """
         errors = []
 
-        def validate_level(elem: IElement):
-            # Track names and their occurrences at this level
-            name_counts: Dict[str, List[IElement]] = {}
+        validate_node = self.validate_node
 
-            for child in elem.children:
-                if "name" in child.attrs:
-                    name = child.attrs["name"]
-                    if name in name_counts:
-                        name_counts[name].append(child)
-                    else:
-                        name_counts[name] = [child]
-
-            # Report duplicates
-            for name, elements in name_counts.items():
-                if len(elements) > 1:
-                    element_tags = [e.tag for e in elements]
-                    errors.append(
-                        f"UNIQUENESS_ERROR: Duplicate name '{name}' found in {len(elements)} elements: "
-                        f"{', '.join(element_tags)} under parent '{elem.tag}'. "
-                        f"Fix: Ensure each element has a unique name within its parent scope."
-                    )
+        def validate_level(elem: IElement):
+            errors.extend(validate_node(elem))
 
             # Recursively validate children
             for child in elem.children:
@@ -68,3 +51,54 @@ class XoscUniquenessValidator:
 
         validate_level(element)
         return errors
+
+    def validate_node(
+        self, element: IElement, schema_info: Optional[ISchemaInfo] = None
+    ) -> List[str]:
+        """
+        Validate name uniqueness among the direct children of a single element
+
+        Args:
+            element: Parent element whose children are checked
+            schema_info: Optional schema information (not used by this validator)
+
+        Returns:
+            List of validation errors
+        """
+        errors = []
+
+        # First element seen for each name; duplicates are only tracked once
+        # one is actually found
+        seen: Dict[str, IElement] = {}
+        duplicates: Optional[Dict[str, List[IElement]]] = None
+
+        children = element.children
+        if len(children) < 2:
+            return errors
+
+        for child in children:
+            name = child.attrs.get("name")
+            if name is None:
+                continue
+            first = seen.get(name)
+            if first is None:
+                seen[name] = child
+            else:
+                if duplicates is None:
+                    duplicates = {}
+                duplicates.setdefault(name, [first]).append(child)
+
+        # Report duplicates in order of first occurrence
+        if duplicates:
+            for name in seen:
+                elements = duplicates.get(name)
+                if elements is None:
+                    continue
+                element_tags = [e.tag for e in elements]
+                errors.append(
+                    f"UNIQUENESS_ERROR: Duplicate name '{name}' found in {len(elements)} elements: "
+                    f"{', '.join(element_tags)} under parent '{element.tag}'. "
+                    f"Fix: Ensure each element has a unique name within its parent scope."
+                )
+
+        return errors
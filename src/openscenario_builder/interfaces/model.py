@@ -3,13 +3,15 @@ Model interface definitions for OpenSCENARIO Builder
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Mapping, Optional, Any
 from datetime import datetime
 
 
 class IElementMetadata(ABC):
     """Abstract base class for element metadata structure"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def created_at(self) -> datetime:
@@ -50,6 +52,8 @@ class IElementMetadata(ABC):
 class IElement(ABC):
     """Abstract base class for element structure"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def tag(self) -> str:
@@ -58,8 +62,13 @@ class IElement(ABC):
 
     @property
     @abstractmethod
-    def attrs(self) -> Dict[str, str]:
-        """Element attributes"""
+    def attrs(self) -> Mapping[str, str]:
+        """
+        Element attributes as a read-only mapping
+
+        Writing through the mapping raises TypeError, whether or not the
+        element has attributes; use set_attribute and remove_attribute.
+        """
         pass
 
     @property
@@ -155,3 +164,7 @@ class IElement(ABC):
     def find_elements_by_tag(self, tag: str) -> List["IElement"]:
         """Find all elements with the specified tag in the subtree"""
         pass
+
+    def find_elements_by_tags(self, tags: Iterable[str]) -> Dict[str, List["IElement"]]:
+        """Find elements for several tags in the subtree, keyed by tag"""
+        return {tag: self.find_elements_by_tag(tag) for tag in tags}
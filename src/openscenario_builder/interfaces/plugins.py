@@ -63,17 +63,10 @@ class IPluginMetadata(ABC):
 class IBasePlugin(ABC):
     """Base interface for all plugins with activation control"""
 
-    @property
-    @abstractmethod
-    def activated(self) -> bool:
-        """Whether this plugin is activated and should be loaded"""
-        pass
-
-    @activated.setter
-    @abstractmethod
-    def activated(self, value: bool) -> None:
-        """Set the activation state of this plugin"""
-        pass
+    # Whether this plugin is activated and should be loaded. A plain
+    # attribute so checks during plugin loading are a single lookup;
+    # set it on the instance to change the activation state.
+    activated: bool = True
 
 
 class IElementPlugin(IBasePlugin):
@@ -3,12 +3,14 @@ Schema interface definitions for OpenSCENARIO Builder
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Mapping
+from typing import Dict, FrozenSet, List, Mapping
 
 
 class IChildElementInfo(ABC):
     """Abstract base class for child element occurrence information"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -31,6 +33,8 @@ class IChildElementInfo(ABC):
 class IAttributeDefinition(ABC):
     """Abstract base class for attribute definition structure"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -53,6 +57,8 @@ class IAttributeDefinition(ABC):
 class IElementDefinition(ABC):
     """Abstract base class for element definition structure"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -101,10 +107,22 @@ class IElementDefinition(ABC):
         """Content model type (sequence, choice, all)"""
         pass
 
+    @property
+    def attr_names_set(self) -> FrozenSet[str]:
+        """Names of all attributes, computed on demand unless overridden"""
+        return frozenset(attr.name for attr in self.attributes)
+
+    @property
+    def children_set(self) -> FrozenSet[str]:
+        """Child names as a set, computed on demand unless overridden"""
+        return frozenset(self.children)
+
 
 class IGroupDefinition(ABC):
     """Abstract base class for group definition structure"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
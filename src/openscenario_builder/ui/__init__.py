@@ -5,6 +5,13 @@ UI components for OpenSCENARIO Builder
 from .qt.main_window import MainWindow
 from .qt.form_widget import ElementFormWidget
 from .qt.tree_widget import ScenarioTreeWidget
+from .qt.tree_model import ScenarioTreeModel
 from .qt.preview_widget import XMLPreviewWidget
 
-__all__ = ["MainWindow", "ElementFormWidget", "ScenarioTreeWidget", "XMLPreviewWidget"]
+__all__ = [
+    "MainWindow",
+    "ElementFormWidget",
+    "ScenarioTreeWidget",
+    "ScenarioTreeModel",
+    "XMLPreviewWidget",
+]
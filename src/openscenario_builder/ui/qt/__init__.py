@@ -5,6 +5,13 @@ Qt-based UI components for OpenSCENARIO Builder
 from .main_window import MainWindow
 from .form_widget import ElementFormWidget
 from .tree_widget import ScenarioTreeWidget
+from .tree_model import ScenarioTreeModel
 from .preview_widget import XMLPreviewWidget
 
-__all__ = ["MainWindow", "ElementFormWidget", "ScenarioTreeWidget", "XMLPreviewWidget"]
+__all__ = [
+    "MainWindow",
+    "ElementFormWidget",
+    "ScenarioTreeWidget",
+    "ScenarioTreeModel",
+    "XMLPreviewWidget",
+]
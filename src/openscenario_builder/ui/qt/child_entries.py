@@ -0,0 +1,65 @@
+"""
+Child Entries for OpenSCENARIO Builder
+Resolves allowed children and GROUP: references into nested menu entries
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+
+# Kinds of child entries
+ENTRY_ELEMENT = 0
+ENTRY_GROUP = 1
+ENTRY_MISSING_GROUP = 2
+
+# (kind, name, nested entries of a group)
+ChildEntry = Tuple[int, str, tuple]
+
+
+def resolve_groups(groups: Dict[str, Any]) -> Dict[str, Tuple[ChildEntry, ...]]:
+    """
+    Resolve every group into its nested child entries
+
+    Each group is resolved once; groups referencing it share the same
+    entries. References back into a group that is still being resolved are
+    dropped, so circular group definitions cannot recurse forever. Groups
+    are resolved in the order of `groups`, so the group listed later loses
+    the back reference: with A listed before B and A <-> B, A's entries
+    contain B, but B's entries omit A.
+    """
+    resolved: Dict[str, Tuple[ChildEntry, ...]] = {}
+    visiting = set()
+
+    def resolve(group_name: str) -> Tuple[ChildEntry, ...]:
+        entries = resolved.get(group_name)
+        if entries is None:
+            visiting.add(group_name)
+            entries = resolved[group_name] = _resolve_names(
+                groups[group_name].children, groups, resolve, visiting
+            )
+            visiting.discard(group_name)
+        return entries
+
+    for group_name in groups:
+        resolve(group_name)
+    return resolved
+
+
+def resolve_children(
+    names: Iterable[str], resolved_groups: Dict[str, Tuple[ChildEntry, ...]]
+) -> Tuple[ChildEntry, ...]:
+    """Resolve child names against groups already resolved by resolve_groups"""
+    return _resolve_names(names, resolved_groups, resolved_groups.__getitem__, ())
+
+
+def _resolve_names(names, groups, resolve, visiting) -> Tuple[ChildEntry, ...]:
+    """Turn child names and GROUP: references into child entries"""
+    entries = []
+    for child_name in names:
+        if child_name.startswith("GROUP:"):
+            group_name = child_name[6:]  # Remove "GROUP:" prefix
+            if group_name not in groups:
+                entries.append((ENTRY_MISSING_GROUP, group_name, ()))
+            elif group_name not in visiting:
+                entries.append((ENTRY_GROUP, group_name, resolve(group_name)))
+        else:
+            entries.append((ENTRY_ELEMENT, child_name, ()))
+    return tuple(entries)
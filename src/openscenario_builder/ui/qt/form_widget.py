@@ -3,7 +3,8 @@ Element Form Widget for OpenSCENARIO Builder
 Provides form interface for editing element properties
 """
 
-from typing import Optional, Dict
+import logging
+from typing import Any, Optional, Dict, List
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,10 +15,15 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QFrame,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from openscenario_builder.core.model.element import Element
 
+logger = logging.getLogger(__name__)
+
+# Definition used for elements unknown to the schema and plugins
+_EMPTY_DEF: Dict[str, Any] = {"attrs": (), "attrs_norm": ()}
+
 
 class ElementFormWidget(QWidget):
     """Form widget for editing element properties"""
@@ -27,6 +33,12 @@ class ElementFormWidget(QWidget):
         self.controller = controller
         self.current_element: Optional[Element] = None
         self.attribute_widgets: Dict[str, QLineEdit] = {}
+        # Attribute fields kept from previous forms for reuse
+        self._line_edit_pool: List[QLineEdit] = []
+
+        # Definitions only change with the schema, not per selection
+        self._definitions: Dict[str, Any] = controller.get_element_definitions()
+        controller.schema_changed.connect(self.on_schema_changed)
 
         self.setup_ui()
 
@@ -54,28 +66,53 @@ class ElementFormWidget(QWidget):
         # Initially hide the update button
         self.update_button.setVisible(False)
 
+        # Coalesce bursts of update requests into one controller call
+        self._pending_update_timer = QTimer(self)
+        self._pending_update_timer.setSingleShot(True)
+        self._pending_update_timer.setInterval(50)
+        self._pending_update_timer.timeout.connect(self._flush_update)
+
     def set_element(self, element: Element):
         """Set the element to edit"""
-        print(
-            f"FormWidget.set_element called with element: {element.tag if element else 'None'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "FormWidget.set_element called with element: %s",
+                element.tag if element else None,
+            )
+        self._apply_pending_update()
         self.current_element = element
         self.build_form()
 
     def build_form(self):
         """Build the form for the current element"""
-        print(
-            f"FormWidget.build_form called for element: {self.current_element.tag if self.current_element else 'None'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "FormWidget.build_form called for element: %s",
+                self.current_element.tag if self.current_element else None,
+            )
         # Clear existing form
         self.clear_form()
 
         if not self.current_element:
             return
 
+        # Suppress repaints and re-layouts until all rows are added
+        self.form_container.setUpdatesEnabled(False)
+        self.form_layout.setEnabled(False)
+        try:
+            attributes = self._add_rows()
+        finally:
+            self.form_layout.setEnabled(True)
+            self.form_container.setUpdatesEnabled(True)
+            self.form_container.updateGeometry()
+
+        # Show update button if there are attributes
+        self.update_button.setVisible(len(attributes) > 0)
+
+    def _add_rows(self):
+        """Add the element name and attribute rows, returning the attributes"""
         # Get element definition
-        definitions = self.controller.get_element_definitions()
-        element_def = definitions.get(self.current_element.tag, {})
+        element_def = self._definitions.get(self.current_element.tag, _EMPTY_DEF)
 
         # Add element name (read-only)
         name_label = QLabel(self.current_element.tag)
@@ -89,20 +126,14 @@ class ElementFormWidget(QWidget):
         self.form_layout.addRow(separator)
 
         # Add attribute fields
-        attributes = element_def.get("attrs", [])
-        for attr_def in attributes:
-            if isinstance(attr_def, dict):
-                attr_name = attr_def["name"]
-                attr_type = attr_def.get("type", "string")
-            else:
-                attr_name = attr_def
-                attr_type = "string"
-
+        attributes = element_def.get("attrs_norm", ())
+        for attr_name, attr_type in attributes:
             # Create label with type info
             label = QLabel(f"{attr_name} ({attr_type})")
 
-            # Create input field
-            input_field = QLineEdit()
+            # Reuse a pooled input field if one is available
+            pool = self._line_edit_pool
+            input_field = pool.pop() if pool else QLineEdit()
             current_value = self.current_element.get_attribute(attr_name, "")
             input_field.setText(current_value)
 
@@ -111,30 +142,59 @@ class ElementFormWidget(QWidget):
 
             # Add to form
             self.form_layout.addRow(label, input_field)
+            input_field.show()
 
-        # Show update button if there are attributes
-        self.update_button.setVisible(len(attributes) > 0)
+        return attributes
+
+    def on_schema_changed(self):
+        """Refresh the cached element definitions"""
+        self._apply_pending_update()
+        self._definitions = self.controller.get_element_definitions()
+        self.build_form()
 
     def clear_form(self):
         """Clear the form"""
-        # Remove all rows except the first one (which is the element name)
-        while self.form_layout.rowCount() > 0:
-            self.form_layout.removeRow(0)
+        pooled = set(self.attribute_widgets.values())
+
+        # Take rows from the end so the remaining rows are never shifted
+        for row in range(self.form_layout.rowCount() - 1, -1, -1):
+            taken = self.form_layout.takeRow(row)
+            for item in (taken.labelItem, taken.fieldItem):
+                widget = item.widget() if item else None
+                if widget is None:
+                    continue
+                if widget in pooled:
+                    # Keep attribute fields for the next form
+                    widget.hide()
+                    widget.clear()
+                    self._line_edit_pool.append(widget)
+                else:
+                    widget.deleteLater()
 
         self.attribute_widgets.clear()
         self.update_button.setVisible(False)
 
     def on_update_attributes(self):
         """Handle update button click"""
+        self._pending_update_timer.start()
+
+    def _apply_pending_update(self):
+        """Apply a pending update before the form is rebuilt"""
+        if self._pending_update_timer.isActive():
+            self._pending_update_timer.stop()
+            self._flush_update()
+
+    def _flush_update(self):
+        """Send the edited attributes to the controller"""
         if not self.current_element:
             return
 
-        # Collect attribute values
-        attributes = {}
-        for attr_name, widget in self.attribute_widgets.items():
-            value = widget.text().strip()
-            if value:
-                attributes[attr_name] = value
+        # Collect non-empty attribute values
+        attributes = {
+            attr_name: value
+            for attr_name, widget in self.attribute_widgets.items()
+            if (value := widget.text().strip())
+        }
 
         # Update element
         self.controller.update_element_attributes(self.current_element, attributes)
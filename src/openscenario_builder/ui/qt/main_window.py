@@ -3,22 +3,24 @@ Qt-based Main Window for OpenSCENARIO Builder
 Decoupled from core business logic
 """
 
-from typing import Optional, Dict, Any
+import logging
+from typing import Optional, Dict, Any, Callable, Iterable, List, Set, Tuple
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QFileDialog,
     QSplitter,
     QTabWidget,
     QMessageBox,
+    QProgressDialog,
     QStatusBar,
     QToolBar,
 )
 from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QThreadPool
 
 from openscenario_builder.core.model.element import Element
 from openscenario_builder.core.schema.parser import SchemaInfo
@@ -26,14 +28,43 @@ from openscenario_builder.core.plugins.plugin_manager import PluginManager
 from .tree_widget import ScenarioTreeWidget
 from .form_widget import ElementFormWidget
 from .preview_widget import XMLPreviewWidget
+from .workers import Worker
+from .child_entries import ChildEntry, resolve_children, resolve_groups
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_attributes(attrs: Iterable[Any]) -> Tuple[Tuple[str, str], ...]:
+    """Convert schema, plugin or plain attribute definitions to (name, type)"""
+    normalized = []
+    for attr_def in attrs:
+        if isinstance(attr_def, dict):
+            normalized.append((attr_def["name"], attr_def.get("type", "string")))
+        elif isinstance(attr_def, str):
+            normalized.append((attr_def, "string"))
+        else:
+            normalized.append((attr_def.name, attr_def.type))
+    return tuple(normalized)
 
 
 class ScenarioController(QObject):
     """Controller that manages scenario state and operations"""
 
     scenario_changed = Signal()
+    schema_changed = Signal()
+    # Fine-grained edits; scenario_edited follows each of them
+    element_about_to_be_added = Signal(Element)
+    element_added = Signal(Element, Element)
+    element_about_to_be_removed = Signal(Element, Element)
+    element_removed = Signal(Element, Element)
+    element_attrs_changed = Signal(Element)
+    scenario_edited = Signal()
     element_selected = Signal(Element)
     validation_errors = Signal(list)
+    # File path and success of a load_scenario_async call
+    scenario_loaded = Signal(str, bool)
+    # File path of a load dropped because the scenario changed meanwhile
+    scenario_load_discarded = Signal(str)
 
     def __init__(self, schema_info: SchemaInfo, plugin_manager: PluginManager):
         super().__init__()
@@ -41,11 +72,32 @@ class ScenarioController(QObject):
         self.plugin_manager = plugin_manager
         self.root_element: Optional[Element] = None
         self.selected_element: Optional[Element] = None
+        # Parent of each element in the scenario, keyed by element id; the
+        # tree model reads parents through find_parent as well
+        self._parent_of: Dict[int, Element] = {}
+        # Merged element definitions and sorted names, built on first use
+        self._element_definitions: Optional[Dict[str, Any]] = None
+        self._element_names: Optional[List[str]] = None
+        # Group references resolved once per schema, and allowed children
+        # resolved against them per element tag
+        self._resolved_groups = resolve_groups(schema_info.groups)
+        self._resolved_children: Dict[str, Tuple[ChildEntry, ...]] = {}
+        # Serialized scenario per pretty flag, cleared on every change
+        self._xml_cache: Dict[bool, str] = {}
+        # Workers still running, kept referenced until they report back
+        self._workers: Set[Worker] = set()
+        # Bumped on every scenario change and on every async request; a
+        # worker result is only applied if nothing was bumped since it started
+        self._scenario_generation = 0
+        self._load_generation = 0
+        self._validation_generation = 0
 
     def create_new_scenario(self) -> None:
         """Create a new empty scenario"""
         self.root_element = Element("OpenSCENARIO")
         self.selected_element = None
+        self._index_parents()
+        self._scenario_modified()
         self.scenario_changed.emit()
 
     def load_scenario(self, file_path: str) -> bool:
@@ -54,15 +106,77 @@ class ScenarioController(QObject):
             # Use plugin manager to import
             scenario = self.plugin_manager.import_scenario(file_path)
             if scenario:
-                self.root_element = scenario
-                self.selected_element = None
-                self.scenario_changed.emit()
+                self._set_scenario(scenario)
                 return True
             return False
         except Exception as e:
             print(f"Failed to load scenario: {e}")
             return False
 
+    def load_scenario_async(self, file_path: str) -> None:
+        """Load scenario from file on a pool thread, then emit scenario_loaded"""
+        # Only the latest load reports back, and a scenario changed while the
+        # file was parsed is not replaced behind the user's back
+        self._load_generation += 1
+        load_generation = self._load_generation
+        scenario_generation = self._scenario_generation
+
+        def on_finished(scenario: Optional[Element]) -> None:
+            if load_generation != self._load_generation:
+                return
+            if scenario_generation != self._scenario_generation:
+                self.scenario_load_discarded.emit(file_path)
+                return
+            if scenario:
+                self._set_scenario(scenario)
+            self.scenario_loaded.emit(file_path, bool(scenario))
+
+        def on_failed(message: str) -> None:
+            if load_generation != self._load_generation:
+                return
+            print(f"Failed to load scenario: {message}")
+            self.scenario_loaded.emit(file_path, False)
+
+        self._start_worker(
+            Worker(self.plugin_manager.import_scenario, file_path),
+            on_finished,
+            on_failed,
+        )
+
+    def _set_scenario(self, scenario: Element) -> None:
+        """Make a loaded scenario the current one"""
+        self.root_element = scenario
+        self.selected_element = None
+        self._index_parents()
+        self._scenario_modified()
+        self.scenario_changed.emit()
+
+    def _scenario_modified(self) -> None:
+        """Drop cached output and results of work started before the change"""
+        self._xml_cache.clear()
+        self._scenario_generation += 1
+
+    def _start_worker(
+        self,
+        worker: Worker,
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[str], None],
+    ) -> None:
+        """Run a worker on the global thread pool"""
+
+        def finished(result: Any) -> None:
+            self._workers.discard(worker)
+            on_finished(result)
+
+        def failed(message: str) -> None:
+            self._workers.discard(worker)
+            on_failed(message)
+
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        self._workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
     def save_scenario(self, file_path: str) -> bool:
         """Save scenario to file"""
         if not self.root_element:
@@ -91,14 +205,18 @@ class ScenarioController(QObject):
 
         # Set default attributes
         for attr_def in element_def.attributes:
-            if attr_def.get("required", False):
-                new_element.set_attribute(attr_def["name"], "")
+            if attr_def.required:
+                new_element.set_attribute(attr_def.name, "")
 
         # Add to parent
         target_parent = parent_element or self.root_element
+        self.element_about_to_be_added.emit(target_parent)
         target_parent.add_child(new_element)
+        self._parent_of[id(new_element)] = target_parent
+        self._scenario_modified()
+        self.element_added.emit(target_parent, new_element)
 
-        self.scenario_changed.emit()
+        self.scenario_edited.emit()
         return new_element
 
     def remove_element(self, element: Element) -> bool:
@@ -107,20 +225,26 @@ class ScenarioController(QObject):
             return False
 
         # Find parent and remove
-        parent = self._find_parent(element)
+        parent = self.find_parent(element)
         if parent:
+            self.element_about_to_be_removed.emit(parent, element)
             parent.remove_child(element)
+            self._unindex_parents(element)
+            self._scenario_modified()
+            self.element_removed.emit(parent, element)
             if self.selected_element == element:
                 self.selected_element = None
-            self.scenario_changed.emit()
+            self.scenario_edited.emit()
             return True
         return False
 
     def select_element(self, element: Element) -> None:
         """Select an element"""
-        print(
-            f"Controller.select_element called with: {element.tag if element else 'None'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Controller.select_element called with: %s",
+                element.tag if element else None,
+            )
         self.selected_element = element
         self.element_selected.emit(element)
 
@@ -128,19 +252,40 @@ class ScenarioController(QObject):
         self, element: Element, attributes: Dict[str, str]
     ) -> None:
         """Update element attributes"""
+        # The form submits every field; only touch attributes that differ
+        current = element.attrs
+        changed = False
         for name, value in attributes.items():
             if value:
-                element.set_attribute(name, value)
-            else:
-                element.remove_attribute(name)
-
-        self.scenario_changed.emit()
+                if current.get(name) != value:
+                    element.set_attribute(name, value)
+                    changed = True
+            elif element.remove_attribute(name):
+                changed = True
+
+        if changed:
+            self._scenario_modified()
+            self.element_attrs_changed.emit(element)
+            self.scenario_edited.emit()
+
+    def get_xml(self, pretty: bool = True) -> str:
+        """Get the scenario as XML, serialized again only after changes"""
+        if not self.root_element:
+            return ""
+        xml = self._xml_cache.get(pretty)
+        if xml is None:
+            xml = self._xml_cache[pretty] = self.root_element.to_xml_string(
+                pretty=pretty
+            )
+        return xml
 
     def validate_scenario(self) -> list:
         """Validate the current scenario"""
         if not self.root_element:
             return []
 
+        # Results of validations still running would be older than these
+        self._validation_generation += 1
         errors = []
 
         plugin_errors = self.plugin_manager.validate_scenario(
@@ -151,24 +296,99 @@ class ScenarioController(QObject):
         self.validation_errors.emit(errors)
         return errors
 
-    def _find_parent(self, element: Element) -> Optional[Element]:
-        """Find the parent of an element"""
+    def validate_scenario_async(self) -> None:
+        """Validate a snapshot of the scenario on a pool thread"""
+        # Errors are only reported while no newer validation was requested
+        # and the scenario is still the one that was validated
+        self._validation_generation += 1
         if not self.root_element:
-            return None
+            self.validation_errors.emit([])
+            return
 
-        def find_in_subtree(parent: Element, target: Element) -> Optional[Element]:
-            for child in parent.children:
-                if child == target:
-                    return parent
-                result = find_in_subtree(child, target)
-                if result:
-                    return result
-            return None
+        generations = (self._validation_generation, self._scenario_generation)
 
-        return find_in_subtree(self.root_element, element)
+        def is_current() -> bool:
+            return generations == (
+                self._validation_generation,
+                self._scenario_generation,
+            )
+
+        def on_finished(errors: list) -> None:
+            if is_current():
+                self.validation_errors.emit(errors)
+
+        def on_failed(message: str) -> None:
+            if is_current():
+                self.validation_errors.emit([f"VALIDATION_FAILED: {message}"])
+
+        # Validate a copy so edits made meanwhile cannot race the validators
+        self._start_worker(
+            Worker(
+                self.plugin_manager.validate_scenario,
+                self.root_element.clone(),
+                self.schema_info,
+            ),
+            on_finished,
+            on_failed,
+        )
+
+    def find_parent(self, element: Element) -> Optional[Element]:
+        """Find the parent of an element"""
+        return self._parent_of.get(id(element))
+
+    @property
+    def element_count(self) -> int:
+        """Number of elements in the current scenario"""
+        if not self.root_element:
+            return 0
+        return len(self._parent_of) + 1
+
+    def _index_parents(self) -> None:
+        """Rebuild the parent map for the current scenario"""
+        parent_of: Dict[int, Element] = {}
+        if self.root_element:
+            stack = [self.root_element]
+            while stack:
+                parent = stack.pop()
+                for child in parent.children:
+                    parent_of[id(child)] = parent
+                    stack.append(child)
+        self._parent_of = parent_of
+
+    def _unindex_parents(self, element: Element) -> None:
+        """Drop a removed element and its descendants from the parent map"""
+        parent_of = self._parent_of
+        parent_of.pop(id(element), None)
+        stack = [element]
+        while stack:
+            for child in stack.pop().children:
+                parent_of.pop(id(child), None)
+                stack.append(child)
 
     def get_element_definitions(self) -> Dict[str, Any]:
-        """Get all element definitions"""
+        """Get all element definitions, merged once per schema"""
+        if self._element_definitions is None:
+            self._element_definitions = self._build_element_definitions()
+        return self._element_definitions
+
+    def get_available_elements(self) -> List[str]:
+        """Get the sorted names of all element definitions"""
+        if self._element_names is None:
+            self._element_names = sorted(self.get_element_definitions())
+        return self._element_names
+
+    def get_resolved_children(self, tag: str) -> Tuple[ChildEntry, ...]:
+        """Get the allowed children of an element tag with groups resolved"""
+        entries = self._resolved_children.get(tag)
+        if entries is None:
+            element_def = self.get_element_definitions().get(tag, {})
+            entries = self._resolved_children[tag] = resolve_children(
+                element_def.get("children", []), self._resolved_groups
+            )
+        return entries
+
+    def _build_element_definitions(self) -> Dict[str, Any]:
+        """Combine schema and plugin element definitions"""
         # Combine schema definitions with plugin definitions
         definitions = {}
 
@@ -185,12 +405,33 @@ class ScenarioController(QObject):
         plugin_definitions = self.plugin_manager.get_element_definitions()
         definitions.update(plugin_definitions)
 
-        return definitions
+        # Resolve attribute names and types once for the form, on copies so
+        # the definitions owned by plugins are left untouched
+        return {
+            name: {
+                **definition,
+                "attrs_norm": _normalize_attributes(definition.get("attrs", [])),
+            }
+            for name, definition in definitions.items()
+        }
 
     def get_schema_info(self) -> SchemaInfo:
         """Get the schema information"""
         return self.schema_info
 
+    def set_schema_info(self, schema_info: SchemaInfo) -> None:
+        """Replace the schema information"""
+        self.schema_info = schema_info
+        self._resolved_groups = resolve_groups(schema_info.groups)
+        self.invalidate_element_definitions()
+        self.schema_changed.emit()
+
+    def invalidate_element_definitions(self) -> None:
+        """Drop the merged element definitions, e.g. after reloading plugins"""
+        self._element_definitions = None
+        self._element_names = None
+        self._resolved_children.clear()
+
 
 class MainWindow(QMainWindow):
     """Main application window"""
@@ -202,6 +443,8 @@ class MainWindow(QMainWindow):
 
         # Initialize controller
         self.controller = ScenarioController(schema_info, plugin_manager)
+        # Shown while a scenario is loaded in the background
+        self._load_progress: Optional[QProgressDialog] = None
 
         # Setup UI
         self.setup_ui()
@@ -280,7 +523,7 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self.preview_widget, "XML Preview")
 
         # Validation tab
-        self.validation_widget = QTextEdit()
+        self.validation_widget = QPlainTextEdit()
         self.validation_widget.setReadOnly(True)
         self.tab_widget.addTab(self.validation_widget, "Validation")
 
@@ -290,8 +533,11 @@ class MainWindow(QMainWindow):
         """Setup signal connections"""
         # Controller signals
         self.controller.scenario_changed.connect(self.on_scenario_changed)
+        self.controller.scenario_edited.connect(self.on_scenario_edited)
         self.controller.element_selected.connect(self.on_element_selected)
         self.controller.validation_errors.connect(self.on_validation_errors)
+        self.controller.scenario_loaded.connect(self.on_scenario_loaded)
+        self.controller.scenario_load_discarded.connect(self.on_scenario_load_discarded)
 
         # UI signals
         # self.add_button.clicked.connect(self.on_add_element)
@@ -370,8 +616,7 @@ class MainWindow(QMainWindow):
 
     def get_available_elements(self) -> list:
         """Get list of available element types"""
-        definitions = self.controller.get_element_definitions()
-        return sorted(definitions.keys())
+        return list(self.controller.get_available_elements())
 
     def on_scenario_changed(self):
         """Handle scenario changes"""
@@ -379,11 +624,19 @@ class MainWindow(QMainWindow):
         self.preview_widget.refresh()
         self.statusbar.showMessage("Scenario updated")
 
+    def on_scenario_edited(self):
+        """Handle edits within the current scenario"""
+        # The tree follows the controller's fine-grained signals itself
+        self.preview_widget.refresh()
+        self.statusbar.showMessage("Scenario updated")
+
     def on_element_selected(self, element: Element):
         """Handle element selection"""
-        print(
-            f"MainWindow.on_element_selected called with: {element.tag if element else 'None'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "MainWindow.on_element_selected called with: %s",
+                element.tag if element else None,
+            )
         self.form_widget.set_element(element)
 
     def on_validation_errors(self, errors: list):
@@ -391,8 +644,10 @@ class MainWindow(QMainWindow):
         if errors:
             self.validation_widget.setPlainText("\n".join(errors))
             self.tab_widget.setCurrentWidget(self.validation_widget)
+            self.statusbar.showMessage(f"Validation found {len(errors)} errors")
         else:
             self.validation_widget.setPlainText("No validation errors found.")
+            self.statusbar.showMessage("Validation passed")
 
     def on_add_element(self):
         """Add a new element"""
@@ -449,10 +704,38 @@ class MainWindow(QMainWindow):
                 "OpenSCENARIO Files (*.xosc);;XML Files (*.xml);;All Files (*)",
             )
             if file_path:
-                if self.controller.load_scenario(file_path):
-                    self.statusbar.showMessage(f"Opened {file_path}")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to open scenario file")
+                # Busy indicator while the file is parsed in the background;
+                # a newer load replaces the indicator of an earlier one
+                self._close_load_progress()
+                self._load_progress = QProgressDialog(
+                    f"Opening {file_path}...", "", 0, 0, self
+                )
+                self._load_progress.setCancelButton(None)
+                self._load_progress.setWindowModality(Qt.WindowModality.WindowModal)
+                self._load_progress.show()
+                self.controller.load_scenario_async(file_path)
+
+    def on_scenario_loaded(self, file_path: str, success: bool):
+        """Handle the end of a background scenario load"""
+        self._close_load_progress()
+
+        if success:
+            self.statusbar.showMessage(f"Opened {file_path}")
+        else:
+            QMessageBox.critical(self, "Error", "Failed to open scenario file")
+
+    def on_scenario_load_discarded(self, file_path: str):
+        """Handle a background load dropped because the scenario changed"""
+        self._close_load_progress()
+        self.statusbar.showMessage(
+            f"Discarded {file_path}: the scenario changed while it was loading"
+        )
+
+    def _close_load_progress(self):
+        """Close the busy indicator of a background load, if shown"""
+        if self._load_progress is not None:
+            self._load_progress.close()
+            self._load_progress = None
 
     def on_save_scenario(self) -> bool:
         """Save scenario"""
@@ -475,11 +758,8 @@ class MainWindow(QMainWindow):
 
     def on_validate_scenario(self):
         """Validate scenario"""
-        errors = self.controller.validate_scenario()
-        if errors:
-            self.statusbar.showMessage(f"Validation found {len(errors)} errors")
-        else:
-            self.statusbar.showMessage("Validation passed")
+        self.statusbar.showMessage("Validating...")
+        self.controller.validate_scenario_async()
 
     def on_about(self):
         """Show about dialog"""
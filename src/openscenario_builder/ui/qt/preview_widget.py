@@ -3,13 +3,34 @@ XML Preview Widget for OpenSCENARIO Builder
 Displays the generated XML with syntax highlighting
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QHBoxLayout, QPushButton
-from PySide6.QtGui import QFont, QTextCharFormat, QSyntaxHighlighter, QColor
+import re
+from collections import deque
+from typing import Deque
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QPlainTextEdit,
+    QHBoxLayout,
+    QPushButton,
+)
+from PySide6.QtGui import (
+    QFont,
+    QTextCharFormat,
+    QTextCursor,
+    QSyntaxHighlighter,
+    QColor,
+)
+from PySide6.QtCore import QTimer
 
 
 class XMLHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for XML"""
 
+    # Compiled once; highlightBlock runs for every line of the preview
+    TAG_PATTERN = re.compile(r"<[^>]+>")
+    ATTR_PATTERN = re.compile(r'\s+(\w+)="([^"]*)"')
+
     def __init__(self, parent):
         super().__init__(parent)
         self.setup_formats()
@@ -31,35 +52,58 @@ class XMLHighlighter(QSyntaxHighlighter):
 
     def highlightBlock(self, text):
         """Highlight a block of text"""
-        import re
+        if "<" not in text:
+            # Text-only lines have no tags to scan for
+            return
 
-        # Highlight tags
-        tag_pattern = r"<[^>]+>"
-        for match in re.finditer(tag_pattern, text):
-            start = match.start()
-            end = match.end()
-            self.setFormat(start, end - start, self.tag_format)
+        set_format = self.setFormat
+        attr_finditer = self.ATTR_PATTERN.finditer
 
-        # Highlight attributes
-        attr_pattern = r'\s+(\w+)="([^"]*)"'
-        for match in re.finditer(attr_pattern, text):
-            attr_start = match.start(1)
-            attr_end = match.end(1)
-            value_start = match.start(2)
-            value_end = match.end(2)
+        for tag in self.TAG_PATTERN.finditer(text):
+            # Highlight the tag
+            start = tag.start()
+            end = tag.end()
+            set_format(start, end - start, self.tag_format)
 
-            self.setFormat(attr_start, attr_end - attr_start, self.attr_format)
-            self.setFormat(value_start, value_end - value_start, self.value_format)
+            # Highlight its attributes, scanning only the tag itself
+            for match in attr_finditer(text, start, end):
+                attr_start = match.start(1)
+                value_start = match.start(2)
+                set_format(attr_start, match.end(1) - attr_start, self.attr_format)
+                set_format(value_start, match.end(2) - value_start, self.value_format)
 
 
 class XMLPreviewWidget(QWidget):
     """Widget for previewing XML output"""
 
+    # Quiet period before a requested refresh regenerates the XML
+    REFRESH_DELAY_MS = 150
+
+    # Larger documents are inserted this many lines at a time, letting the
+    # event loop run between chunks while the highlighter catches up
+    CHUNK_LINES = 2000
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         self.setup_ui()
 
+        # Coalesce bursts of refresh requests into one regeneration
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Set when a refresh was requested while the preview was hidden
+        self._dirty = False
+
+        # Remaining text of a large document still being inserted
+        self._pending_chunks: Deque[str] = deque()
+        self._chunk_timer = QTimer(self)
+        self._chunk_timer.setSingleShot(True)
+        self._chunk_timer.setInterval(0)
+        self._chunk_timer.timeout.connect(self._insert_next_chunk)
+
     def setup_ui(self):
         """Setup the preview widget UI"""
         layout = QVBoxLayout(self)
@@ -68,7 +112,7 @@ class XMLPreviewWidget(QWidget):
         toolbar_layout = QHBoxLayout()
 
         self.refresh_button = QPushButton("Refresh")
-        self.refresh_button.clicked.connect(self.refresh)
+        self.refresh_button.clicked.connect(self._do_refresh)
         toolbar_layout.addWidget(self.refresh_button)
 
         self.copy_button = QPushButton("Copy to Clipboard")
@@ -79,8 +123,10 @@ class XMLPreviewWidget(QWidget):
         layout.addLayout(toolbar_layout)
 
         # Text editor
-        self.text_edit = QTextEdit()
+        # Plain text layout is line based and much cheaper for large documents
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.text_edit.setFont(QFont("Courier", 10))
 
         # Setup syntax highlighting
@@ -89,15 +135,63 @@ class XMLPreviewWidget(QWidget):
         layout.addWidget(self.text_edit)
 
     def refresh(self):
-        """Refresh the XML preview"""
-        if self.controller.root_element:
-            xml_content = self.controller.root_element.to_xml_string(pretty=True)
-            self.text_edit.setPlainText(xml_content)
-        else:
+        """Request a refresh of the XML preview once edits settle"""
+        if not self.isVisible():
+            # Regenerate when the preview is shown again
+            self._dirty = True
+            return
+        self._refresh_timer.start()
+
+    def showEvent(self, event):
+        """Bring a stale preview up to date when it becomes visible"""
+        super().showEvent(event)
+        if self._dirty:
+            self._do_refresh()
+
+    def _do_refresh(self):
+        """Regenerate the XML preview now"""
+        self._refresh_timer.stop()
+        self._dirty = False
+        self._chunk_timer.stop()
+        self._pending_chunks.clear()
+
+        if not self.controller.root_element:
             self.text_edit.setPlainText("No scenario loaded.")
+            return
+
+        xml_content = self.controller.get_xml(pretty=True)
+        lines = xml_content.splitlines(keepends=True)
+        if len(lines) <= self.CHUNK_LINES:
+            self.text_edit.setPlainText(xml_content)
+            return
+
+        # Show the first chunk now and append the rest from the event loop
+        step = self.CHUNK_LINES
+        self._pending_chunks.extend(
+            "".join(lines[i : i + step]) for i in range(step, len(lines), step)
+        )
+        self.text_edit.setPlainText("".join(lines[:step]))
+        self._chunk_timer.start()
+
+    def _insert_next_chunk(self):
+        """Append the next pending chunk of a large document"""
+        if not self._pending_chunks:
+            return
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(self._pending_chunks.popleft())
+        if self._pending_chunks:
+            self._chunk_timer.start()
+
+    def _finish_chunks(self):
+        """Insert all pending chunks right away"""
+        self._chunk_timer.stop()
+        while self._pending_chunks:
+            self._insert_next_chunk()
 
     def copy_to_clipboard(self):
         """Copy XML content to clipboard"""
+        self._finish_chunks()
         cursor = self.text_edit.textCursor()
         if cursor.hasSelection():
             # Copy selected text
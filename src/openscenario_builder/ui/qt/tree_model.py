@@ -0,0 +1,156 @@
+"""
+Scenario Tree Model for OpenSCENARIO Builder
+Exposes the Element tree to Qt item views without copying it
+"""
+
+from typing import Any, Callable, Dict, Optional
+from weakref import WeakKeyDictionary
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from openscenario_builder.core.model.element import Element
+
+
+class ScenarioTreeModel(QAbstractItemModel):
+    """
+    Item model that reads rows straight from an Element tree
+
+    Each index points at its Element, so views only query the rows they
+    display and no per-element item objects are kept. The root element is
+    the single top-level row. Parents are looked up through find_parent,
+    supplied by whoever owns and edits the tree.
+    """
+
+    HEADERS = ("Element", "Attributes")
+
+    def __init__(
+        self, find_parent: Callable[[Element], Optional[Element]], parent=None
+    ):
+        super().__init__(parent)
+        self._root: Optional[Element] = None
+        self._find_parent = find_parent
+        # Row of each child keyed by child id, per parent, built on first
+        # lookup so parent() does not scan the siblings
+        self._rows: "WeakKeyDictionary[Element, Dict[int, int]]" = WeakKeyDictionary()
+
+    @property
+    def root_element(self) -> Optional[Element]:
+        """Root element shown by the model"""
+        return self._root
+
+    def set_root_element(self, root: Optional[Element]) -> None:
+        """Show a new element tree, resetting attached views"""
+        self.beginResetModel()
+        self._root = root
+        self._rows.clear()
+        self.endResetModel()
+
+    def begin_add_child(self, parent: Element) -> None:
+        """Announce that a child is about to be appended to parent"""
+        row = len(parent.children)
+        self.beginInsertRows(self.index_for_element(parent), row, row)
+
+    def end_add_child(self, parent: Element, child: Element) -> None:
+        """Finish appending child to parent"""
+        rows = self._rows.get(parent)
+        if rows is not None:
+            rows[id(child)] = len(parent.children) - 1
+        self.endInsertRows()
+
+    def begin_remove_child(self, parent: Element, child: Element) -> None:
+        """Announce that child is about to be removed from parent"""
+        row = self._row_of(parent, child)
+        self.beginRemoveRows(self.index_for_element(parent), row, row)
+
+    def end_remove_child(self, parent: Element, child: Element) -> None:
+        """Finish removing child from parent"""
+        # Later siblings moved up a row
+        self._rows.pop(parent, None)
+        self.endRemoveRows()
+
+    def attributes_changed(self, element: Element) -> None:
+        """Notify views that the attributes of an element changed"""
+        index = self.index_for_element(element, 1)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def element_from_index(self, index: QModelIndex) -> Optional[Element]:
+        """Get the element an index points at"""
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def index_for_element(self, element: Element, column: int = 0) -> QModelIndex:
+        """Get the index of an element in the tree"""
+        if element is self._root:
+            return self.createIndex(0, column, element)
+
+        parent = self._find_parent(element)
+        if parent is None:
+            return QModelIndex()
+        return self.createIndex(self._row_of(parent, element), column, element)
+
+    def _row_of(self, parent: Element, child: Element) -> int:
+        """Get the row of a child within its parent"""
+        rows = self._rows.get(parent)
+        if rows is None:
+            rows = self._rows[parent] = {
+                id(sibling): row for row, sibling in enumerate(parent.children)
+            }
+        return rows[id(child)]
+
+    def index(
+        self, row: int, column: int, parent: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, self._root)
+
+        parent_element = parent.internalPointer()
+        return self.createIndex(row, column, parent_element.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+
+        parent = self._find_parent(index.internalPointer())
+        if parent is None:
+            return QModelIndex()
+        return self.index_for_element(parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return 0 if self._root is None else 1
+        return len(parent.internalPointer().children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        element = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return element.tag
+            return element.attrs_text
+        if role == Qt.ItemDataRole.UserRole:
+            return element
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
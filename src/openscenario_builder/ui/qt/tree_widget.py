@@ -3,164 +3,168 @@ Scenario Tree Widget for OpenSCENARIO Builder
 Displays the scenario hierarchy in a tree view
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu
-from PySide6.QtCore import Qt, Signal
+import logging
+from typing import Dict, Iterable, Optional
+from PySide6.QtWidgets import QTreeView, QMenu
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtGui import QAction
 
 from openscenario_builder.core.model.element import Element
+from .tree_model import ScenarioTreeModel
+from .child_entries import ChildEntry, ENTRY_GROUP, ENTRY_MISSING_GROUP
 
+logger = logging.getLogger(__name__)
 
-class ScenarioTreeWidget(QTreeWidget):
-    """Tree widget for displaying scenario hierarchy"""
+
+class ScenarioTreeWidget(QTreeView):
+    """Tree view displaying the scenario hierarchy through a ScenarioTreeModel"""
 
     element_selected = Signal(Element)
     element_deleted = Signal(Element)
 
+    # Larger scenarios open expanded to EXPAND_DEPTH only; deeper rows are
+    # read from the model when the user expands them
+    EXPAND_ALL_LIMIT = 2000
+    EXPAND_DEPTH = 1
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
+        self.tree_model = ScenarioTreeModel(controller.find_parent, self)
+        # Context menus built once per element tag and reused; their actions
+        # act on the element the menu was last opened for
+        self._menu_cache: Dict[str, QMenu] = {}
+        self._context_element: Optional[Element] = None
+        self._delete_action = QAction("Delete", self)
+        self._delete_action.triggered.connect(self._on_delete_triggered)
+        self.setModel(self.tree_model)
         self.setup_ui()
         self.setup_connections()
 
     def setup_ui(self):
         """Setup the tree widget UI"""
-        self.setHeaderLabels(["Element", "Attributes"])
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.setAlternatingRowColors(True)
         self.setExpandsOnDoubleClick(True)
+        # All rows are single-line text; let Qt skip per-row height queries
+        self.setUniformRowHeights(True)
+        self.setItemsExpandable(True)
+        self.setAnimated(False)
 
     def setup_connections(self):
         """Setup signal connections"""
-        self.itemClicked.connect(self.on_item_clicked)
+        self.selectionModel().currentChanged.connect(self.on_current_changed)
         self.customContextMenuRequested.connect(self.on_context_menu)
 
+        # Follow fine-grained scenario edits without resetting the model
+        controller = self.controller
+        model = self.tree_model
+        controller.element_about_to_be_added.connect(model.begin_add_child)
+        controller.element_added.connect(model.end_add_child)
+        controller.element_added.connect(self.on_element_added)
+        controller.element_about_to_be_removed.connect(model.begin_remove_child)
+        controller.element_removed.connect(model.end_remove_child)
+        controller.element_attrs_changed.connect(model.attributes_changed)
+        controller.schema_changed.connect(self.on_schema_changed)
+
     def refresh(self):
         """Refresh the tree display"""
-        self.clear()
-        if self.controller.root_element:
-            self.populate_tree(self.controller.root_element, None)
-        self.expandAll()
-
-    def populate_tree(self, element: Element, parent_item: Optional[QTreeWidgetItem]):
-        """Populate the tree with element hierarchy"""
-        # Create item text
-        attrs_text = " ".join([f'{k}="{v}"' for k, v in element.attrs.items()])
-        item_text = f"{element.tag}"
-
-        # Create tree item
-        if parent_item:
-            item = QTreeWidgetItem(parent_item)
-        else:
-            item = QTreeWidgetItem(self)
-
-        item.setText(0, item_text)
-        item.setText(1, attrs_text)
-        item.setData(0, Qt.ItemDataRole.UserRole, element)
-
-        # Add children recursively
-        for child in element.children:
-            self.populate_tree(child, item)
-
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
-        """Handle item click"""
-        element = item.data(0, Qt.ItemDataRole.UserRole)
+        # Reset and expand in one pass, repainting only once at the end
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.tree_model.set_root_element(self.controller.root_element)
+            if self.controller.element_count <= self.EXPAND_ALL_LIMIT:
+                self.expandAll()
+            else:
+                self.expandToDepth(self.EXPAND_DEPTH)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
+    def on_schema_changed(self):
+        """Forget menus resolved against the previous schema"""
+        for menu in self._menu_cache.values():
+            menu.deleteLater()
+        self._menu_cache.clear()
+
+    def on_element_added(self, parent: Element, element: Element):
+        """Keep a newly added element visible"""
+        self.expand(self.tree_model.index_for_element(parent))
+
+    def on_current_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Handle current index change"""
+        element = self.tree_model.element_from_index(current)
         if element:
-            print(
-                f"TreeWidget: Item clicked, emitting element_selected for: {element.tag}"
+            logger.debug(
+                "TreeWidget: Current item changed, emitting element_selected for: %s",
+                element.tag,
             )
             self.element_selected.emit(element)
 
     def on_context_menu(self, position):
         """Handle context menu request"""
-        item = self.itemAt(position)
-        if not item:
-            return
-
-        element = item.data(0, Qt.ItemDataRole.UserRole)
+        element = self.tree_model.element_from_index(self.indexAt(position))
         if not element:
             return
 
+        menu = self._menu_cache.get(element.tag)
+        if menu is None:
+            menu = self._menu_cache[element.tag] = self._build_context_menu(element.tag)
+
+        # Delete action, not offered for the root element
+        self._delete_action.setVisible(element is not self.controller.root_element)
+
+        self._context_element = element
+        try:
+            menu.exec(self.viewport().mapToGlobal(position))
+        finally:
+            self._context_element = None
+
+    def _build_context_menu(self, tag: str) -> QMenu:
+        """Build the context menu for elements with the given tag"""
         menu = QMenu(self)
 
-        # Add child element actions
+        # Add child element actions, handled by one slot reading action data
         add_menu = menu.addMenu("Add Child")
-        definitions = self.controller.get_element_definitions()
-        element_def = definitions.get(element.tag, {})
-
-        # Get schema info for groups
-        schema_info = self.controller.get_schema_info()
-        groups = schema_info.groups if schema_info else {}
-
-        for child_name in element_def.get("children", []):
-            if child_name.startswith("GROUP:"):
-                # This is a group reference, create a submenu
-                group_name = child_name[6:]  # Remove "GROUP:" prefix
-                if group_name in groups:
-                    group = groups[group_name]
-                    group_menu = add_menu.addMenu(f"📁 {group_name}")
-                    self._add_group_children(group_menu, group, groups, element)
-                else:
-                    # Group not found, add as regular item
-                    action = QAction(f"❓ {group_name} (not found)", self)
-                    action.setEnabled(False)
-                    group_menu.addAction(action)
-            else:
-                # Regular element
-                action = QAction(child_name, self)
-                action.triggered.connect(
-                    lambda checked, name=child_name: self.add_child_element(
-                        element, name
-                    )
-                )
-                add_menu.addAction(action)
+        self._add_menu_entries(add_menu, self.controller.get_resolved_children(tag))
+        add_menu.triggered.connect(self._on_add_child_triggered)
 
         menu.addSeparator()
-
-        # Delete action
-        if element != self.controller.root_element:
-            delete_action = QAction("Delete", self)
-            delete_action.triggered.connect(lambda: self.delete_element(element))
-            menu.addAction(delete_action)
-
-        menu.exec(self.viewport().mapToGlobal(position))
-
-    def _add_group_children(
-        self, parent_menu: QMenu, group, groups: dict, parent_element: Element
-    ):
-        """Recursively add group children to menu"""
-        for child_name in group.children:
-            if child_name.startswith("GROUP:"):
-                # Nested group reference
-                nested_group_name = child_name[6:]
-                if nested_group_name in groups:
-                    nested_group = groups[nested_group_name]
-                    nested_menu = parent_menu.addMenu(f"📁 {nested_group_name}")
-                    self._add_group_children(
-                        nested_menu, nested_group, groups, parent_element
-                    )
-                else:
-                    # Group not found
-                    action = QAction(f"❓ {nested_group_name} (not found)", self)
-                    action.setEnabled(False)
-                    parent_menu.addAction(action)
+        menu.addAction(self._delete_action)
+        return menu
+
+    def _on_add_child_triggered(self, action: QAction):
+        """Add the child named by a triggered "Add Child" action"""
+        child_name = action.data()
+        if child_name and self._context_element is not None:
+            self.add_child_element(self._context_element, child_name)
+
+    def _on_delete_triggered(self):
+        """Delete the element the context menu was opened for"""
+        if self._context_element is not None:
+            self.delete_element(self._context_element)
+
+    def _add_menu_entries(self, parent_menu: QMenu, entries: Iterable[ChildEntry]):
+        """Add resolved child entries to a menu, with a submenu per group"""
+        for kind, name, nested in entries:
+            if kind == ENTRY_GROUP:
+                group_menu = parent_menu.addMenu(f"📁 {name}")
+                self._add_menu_entries(group_menu, nested)
+            elif kind == ENTRY_MISSING_GROUP:
+                # Group not found, add as disabled item
+                action = parent_menu.addAction(f"❓ {name} (not found)")
+                action.setEnabled(False)
             else:
-                # Regular element
-                action = QAction(child_name, self)
-                action.triggered.connect(
-                    lambda checked, name=child_name: self.add_child_element(
-                        parent_element, name
-                    )
-                )
-                parent_menu.addAction(action)
+                # Regular element, named in the action data
+                action = parent_menu.addAction(name)
+                action.setData(name)
 
     def add_child_element(self, parent_element: Element, child_name: str):
         """Add a child element"""
-        new_element = self.controller.add_element(child_name, parent_element)
-        if new_element:
-            self.refresh()
+        self.controller.add_element(child_name, parent_element)
 
     def delete_element(self, element: Element):
         """Delete an element"""
-        if self.controller.remove_element(element):
-            self.refresh()
+        self.controller.remove_element(element)
@@ -0,0 +1,38 @@
+"""
+Background workers for OpenSCENARIO Builder
+Run blocking plugin calls on the Qt thread pool
+"""
+
+from typing import Any, Callable
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals reporting the outcome of a Worker"""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class Worker(QRunnable):
+    """
+    Runnable calling a function on a pool thread
+
+    The result is emitted through signals, which Qt delivers to receivers
+    in the GUI thread. The function must not touch widgets or data the GUI
+    thread may change while it runs.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
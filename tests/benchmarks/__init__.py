@@ -0,0 +1,5 @@
+"""
+Benchmarks for OpenSCENARIO Builder
+
+Tracks the speed of hot paths. Requires pytest-benchmark.
+"""
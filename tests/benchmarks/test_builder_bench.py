@@ -0,0 +1,65 @@
+"""
+Benchmarks for ElementBuilder
+Times the fluent chain on elements with many attributes and children
+
+Run with: pytest tests/benchmarks -m benchmark
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from openscenario_builder.core.model.element import Element  # noqa: E402
+from openscenario_builder.core.model.element_builder import (  # noqa: E402
+    ElementBuilder,
+)
+from openscenario_builder.core.schema.parser import (  # noqa: E402
+    AttributeDefinition,
+    ChildElementInfo,
+    ElementDefinition,
+    SchemaInfo,
+)
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [10, 100, 1000]
+
+
+def _wide_schema(size: int) -> SchemaInfo:
+    """Create a schema whose Parent accepts size attributes and any Child"""
+    parent_def = ElementDefinition(
+        name="Parent",
+        attributes=[AttributeDefinition(f"a{i}", "string", False) for i in range(size)],
+        children=["Child"],
+        child_occurrence_info={
+            "Child": ChildElementInfo("Child", min_occur=0, max_occur="unbounded")
+        },
+    )
+    child_def = ElementDefinition(
+        name="Child",
+        attributes=[AttributeDefinition("id", "string", True)],
+        children=[],
+    )
+    return SchemaInfo(
+        elements={"Parent": parent_def, "Child": child_def},
+        groups={},
+        root_elements=["Parent"],
+        element_hierarchy={"Parent": ["Child"]},
+        simple_type_definitions={},
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build_large(benchmark, size):
+    """Build an element with size attributes and size children"""
+    builder = ElementBuilder(_wide_schema(size))
+    attrs = {f"a{i}": str(i) for i in range(size)}
+
+    def build():
+        children = [Element("Child", {"id": str(i)}) for i in range(size)]
+        return builder.element("Parent").attrs(attrs).children(children).build()
+
+    element = benchmark(build)
+
+    assert len(element.attrs) == size
+    assert len(element.children) == size
@@ -0,0 +1,53 @@
+"""
+Shared fixtures for core model tests
+"""
+
+import pytest
+from openscenario_builder.core.model.element import Element
+from openscenario_builder.core.schema.parser import (
+    AttributeDefinition,
+    ChildElementInfo,
+    ElementDefinition,
+    SchemaInfo,
+)
+
+
+@pytest.fixture(scope="module")
+def simple_schema():
+    """Create a simple test schema, shared by the tests of a module"""
+    # Define Parent element with required attributes
+    parent_attrs = [
+        AttributeDefinition("name", "string", True),
+        AttributeDefinition("version", "string", False),
+    ]
+    parent_def = ElementDefinition(
+        name="Parent",
+        attributes=parent_attrs,
+        children=["Child"],
+        child_occurrence_info={
+            "Child": ChildElementInfo("Child", min_occur=1, max_occur="unbounded")
+        },
+    )
+
+    # Define Child element
+    child_attrs = [
+        AttributeDefinition("id", "string", True),
+        AttributeDefinition("value", "double", False),
+    ]
+    child_def = ElementDefinition(name="Child", attributes=child_attrs, children=[])
+
+    schema_info = SchemaInfo(
+        elements={"Parent": parent_def, "Child": child_def},
+        groups={},
+        root_elements=["Parent"],
+        element_hierarchy={"Parent": ["Child"]},
+        simple_type_definitions={},
+    )
+
+    return schema_info
+
+
+@pytest.fixture(scope="module")
+def sample_child():
+    """Create a valid Child element, shared by tests that only read it"""
+    return Element("Child", {"id": "Test"})
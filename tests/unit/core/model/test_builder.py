@@ -8,53 +8,52 @@ NOTE: These tests require ElementBuilder from the schema-aware creation branch.
 
 import pytest
 
-# Try to import, skip all tests if not available
-try:
-    from openscenario_builder.core.model.element_builder import ElementBuilder
-
-    BUILDER_AVAILABLE = True
-except ImportError:
-    BUILDER_AVAILABLE = False
-    pytestmark = pytest.mark.skip(reason="ElementBuilder not available on this branch")
-from openscenario_builder.core.model.element import Element
-from openscenario_builder.core.schema.parser import (
-    AttributeDefinition,
+# Skip the whole module if ElementBuilder is not available
+ElementBuilder = pytest.importorskip(
+    "openscenario_builder.core.model.element_builder"
+).ElementBuilder
+
+from openscenario_builder.core.model.element import Element  # noqa: E402
+from openscenario_builder.core.schema.parser import (  # noqa: E402
     ElementDefinition,
     SchemaInfo,
 )
 
+# Schema without any definitions, shared by tests that only read it
+_EMPTY_SCHEMA = SchemaInfo(
+    elements={},
+    groups={},
+    root_elements=[],
+    element_hierarchy={},
+    simple_type_definitions={},
+)
 
-class TestElementBuilder:
-    """Test ElementBuilder fluent API"""
 
-    @pytest.fixture
-    def simple_schema(self):
-        """Create a simple test schema"""
-        # Define Parent element
-        parent_attrs = [
-            AttributeDefinition("name", "string", True),
-            AttributeDefinition("version", "string", False),
-        ]
-        parent_def = ElementDefinition(
-            name="Parent", attributes=parent_attrs, children=["Child"]
-        )
+@pytest.fixture(scope="module")
+def builders(simple_schema):
+    """One strict and one permissive builder, reused across the module"""
+    return {
+        True: ElementBuilder(simple_schema, strict=True),
+        False: ElementBuilder(simple_schema, strict=False),
+    }
 
-        # Define Child element
-        child_attrs = [
-            AttributeDefinition("id", "string", True),
-            AttributeDefinition("value", "double", False),
-        ]
-        child_def = ElementDefinition(name="Child", attributes=child_attrs, children=[])
 
-        schema_info = SchemaInfo(
-            elements={"Parent": parent_def, "Child": child_def},
-            groups={},
-            root_elements=["Parent"],
-            element_hierarchy={"Parent": ["Child"]},
-            simple_type_definitions={},
-        )
+@pytest.fixture
+def builder(builders):
+    """Shared strict builder, reset after each test"""
+    yield builders[True]
+    builders[True].reset()
+
+
+@pytest.fixture
+def permissive_builder(builders):
+    """Shared permissive builder, reset after each test"""
+    yield builders[False]
+    builders[False].reset()
 
-        return schema_info
+
+class TestElementBuilder:
+    """Test ElementBuilder fluent API"""
 
     def test_create_builder_with_schema(self, simple_schema):
         """Should create builder with schema"""
@@ -62,19 +61,15 @@ class TestElementBuilder:
 
         assert builder.factory.schema_info == simple_schema
 
-    def test_build_simple_element(self, simple_schema):
+    def test_build_simple_element(self, builder):
         """Should build simple element"""
-        builder = ElementBuilder(simple_schema)
-
         element = builder.element("Parent").attr("name", "TestParent").build()
 
         assert element.tag == "Parent"
         assert element.get_attribute("name") == "TestParent"
 
-    def test_build_element_with_multiple_attributes(self, simple_schema):
-        """Should build element with multiple attributes"""
-        builder = ElementBuilder(simple_schema)
-
+    def test_attr_chain(self, builder):
+        """Should build element with multiple chained attr() calls"""
         element = (
             builder.element("Parent")
             .attr("name", "Test")
@@ -85,10 +80,8 @@ class TestElementBuilder:
         assert element.get_attribute("name") == "Test"
         assert element.get_attribute("version") == "1.0"
 
-    def test_build_element_with_attrs_dict(self, simple_schema):
+    def test_build_element_with_attrs_dict(self, builder):
         """Should build element with attributes dictionary"""
-        builder = ElementBuilder(simple_schema)
-
         element = (
             builder.element("Parent").attrs({"name": "Test", "version": "1.0"}).build()
         )
@@ -96,24 +89,19 @@ class TestElementBuilder:
         assert element.get_attribute("name") == "Test"
         assert element.get_attribute("version") == "1.0"
 
-    def test_build_element_with_child(self, simple_schema):
+    def test_build_element_with_child(self, builder, sample_child):
         """Should build element with child"""
-        builder = ElementBuilder(simple_schema)
-
-        child = Element("Child")
-        child.set_attribute("id", "1")
-
-        element = builder.element("Parent").attr("name", "Test").child(child).build()
+        element = (
+            builder.element("Parent").attr("name", "Test").child(sample_child).build()
+        )
 
         assert len(element.children) == 1
         assert element.children[0].tag == "Child"
 
-    def test_build_nested_elements(self, simple_schema):
+    def test_build_nested_elements(self, builder):
         """Should build nested elements fluently"""
-        builder = ElementBuilder(simple_schema)
-
         # Build child separately
-        child = builder.element("Child").attr("id", "1").attr("value", "42.0").build()
+        child = builder.element("Child").attrs({"id": "1", "value": "42.0"}).build()
 
         # Build parent with child
         parent = builder.element("Parent").attr("name", "Test").child(child).build()
@@ -122,15 +110,9 @@ class TestElementBuilder:
         assert len(parent.children) == 1
         assert parent.children[0].get_attribute("id") == "1"
 
-    def test_build_with_multiple_children(self, simple_schema):
+    def test_build_with_multiple_children(self, builder):
         """Should build element with multiple children"""
-        builder = ElementBuilder(simple_schema)
-
-        child1 = Element("Child")
-        child1.set_attribute("id", "1")
-
-        child2 = Element("Child")
-        child2.set_attribute("id", "2")
+        child1, child2 = [Element("Child", {"id": str(i)}) for i in (1, 2)]
 
         element = (
             builder.element("Parent")
@@ -142,10 +124,8 @@ class TestElementBuilder:
 
         assert len(element.children) == 2
 
-    def test_builder_reuse(self, simple_schema):
+    def test_builder_reuse(self, builder):
         """Should be able to reuse builder for multiple elements"""
-        builder = ElementBuilder(simple_schema)
-
         element1 = builder.element("Parent").attr("name", "First").build()
 
         element2 = builder.element("Parent").attr("name", "Second").build()
@@ -153,16 +133,15 @@ class TestElementBuilder:
         assert element1.get_attribute("name") == "First"
         assert element2.get_attribute("name") == "Second"
 
-    def test_strict_mode_validation(self, simple_schema):
+    @pytest.mark.slow
+    def test_strict_mode_validation(self, builder):
         """Should validate in strict mode"""
-        builder = ElementBuilder(simple_schema, strict=True)
-
         with pytest.raises(ValueError, match="REQUIRED_ATTRIBUTE_ERROR"):
             builder.element("Parent").build()
 
-    def test_permissive_mode_allows_invalid(self, simple_schema):
+    def test_permissive_mode_allows_invalid(self, permissive_builder):
         """Should allow invalid elements in permissive mode"""
-        builder = ElementBuilder(simple_schema, strict=False)
+        builder = permissive_builder
 
         element = builder.element("Parent").build()
 
@@ -170,36 +149,29 @@ class TestElementBuilder:
         errors = builder.factory.get_validation_errors(element)
         assert len(errors) > 0
 
-    def test_child_validation_strict_mode_valid(self, simple_schema):
+    def test_child_validation_strict_mode_valid(self, builder, sample_child):
         """Should allow valid child in strict mode"""
-        builder = ElementBuilder(simple_schema, strict=True)
-
-        child = Element("Child", {"id": "TestChild"})
-        result = builder.element("Parent").attr("name", "TestParent").child(child)
+        result = (
+            builder.element("Parent").attr("name", "TestParent").child(sample_child)
+        )
 
         assert result is builder
         element = result.build()
         assert len(element.children) == 1
         assert element.children[0].tag == "Child"
 
-    def test_child_validation_strict_mode_invalid(self, simple_schema):
+    @pytest.mark.slow
+    def test_child_validation_strict_mode_invalid(self, builder):
         """Should reject invalid child in strict mode"""
-        builder = ElementBuilder(simple_schema, strict=True)
-
         # Try to add Parent as child of Child (not allowed)
         invalid_child = Element("Parent", {"name": "Invalid"})
 
         with pytest.raises(ValueError, match="Cannot add child 'Parent' to 'Child'"):
             builder.element("Child").attr("id", "Test").child(invalid_child)
 
-    def test_children_validation_strict_mode_valid(self, simple_schema):
+    def test_children_validation_strict_mode_valid(self, builder):
         """Should allow multiple valid children in strict mode"""
-        builder = ElementBuilder(simple_schema, strict=True)
-
-        children = [
-            Element("Child", {"id": "Child1"}),
-            Element("Child", {"id": "Child2"}),
-        ]
+        children = [Element("Child", {"id": f"Child{i}"}) for i in (1, 2)]
 
         element = (
             builder.element("Parent")
@@ -210,10 +182,9 @@ class TestElementBuilder:
 
         assert len(element.children) == 2
 
-    def test_children_validation_strict_mode_invalid(self, simple_schema):
+    @pytest.mark.slow
+    def test_children_validation_strict_mode_invalid(self, builder):
         """Should reject if any child is invalid in strict mode"""
-        builder = ElementBuilder(simple_schema, strict=True)
-
         children = [
             Element("Child", {"id": "Valid"}),
             Element("Parent", {"name": "Invalid"}),  # Not allowed as child of Parent
@@ -223,9 +194,9 @@ class TestElementBuilder:
         with pytest.raises(ValueError, match="Cannot add child 'Parent' to 'Parent'"):
             builder.element("Parent").attr("name", "Test").children(children)
 
-    def test_child_validation_permissive_mode(self, simple_schema):
+    def test_child_validation_permissive_mode(self, permissive_builder):
         """Should allow invalid child in permissive mode"""
-        builder = ElementBuilder(simple_schema, strict=False)
+        builder = permissive_builder
 
         invalid_child = Element("Parent", {"name": "Invalid"})
 
@@ -236,10 +207,8 @@ class TestElementBuilder:
 
         assert len(element.children) == 1
 
-    def test_is_child_allowed(self, simple_schema):
+    def test_is_child_allowed(self, builder):
         """Should correctly check if child is allowed"""
-        builder = ElementBuilder(simple_schema)
-
         builder.element("Parent")
         assert builder.is_child_allowed("Child") is True
         assert builder.is_child_allowed("Parent") is False
@@ -254,14 +223,7 @@ class TestElementBuilderEdgeCases:
 
     def test_build_without_element_call(self):
         """Should raise error when building without element()"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
-        builder = ElementBuilder(schema_info)
+        builder = ElementBuilder(_EMPTY_SCHEMA)
 
         with pytest.raises(ValueError, match="tag must be set"):
             builder.build()
@@ -288,6 +250,16 @@ class TestElementBuilderEdgeCases:
         assert element.get_attribute("second") == "2"
         assert element.get_attribute("third") == "3"
 
+    def test_reset_discards_state(self):
+        """reset() should discard the element being built"""
+        builder = ElementBuilder(_EMPTY_SCHEMA, strict=False)
+
+        result = builder.element("Test").attr("attr1", "value1").reset()
+
+        assert result is builder
+        with pytest.raises(ValueError, match="tag must be set"):
+            builder.build()
+
     def test_build_resets_builder_state(self):
         """build() should reset builder state"""
         schema_info = SchemaInfo(
@@ -311,67 +283,23 @@ class TestElementBuilderEdgeCases:
 class TestElementBuilderChaining:
     """Test method chaining behavior"""
 
-    def test_element_returns_self(self):
-        """element() should return self for chaining"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
-        builder = ElementBuilder(schema_info)
-
-        result = builder.element("Test")
-
-        assert result is builder
-
-    def test_attr_returns_self(self):
-        """attr() should return self for chaining"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
-        builder = ElementBuilder(schema_info)
-
-        result = builder.element("Test").attr("key", "value")
-
-        assert result is builder
-
-    def test_attrs_returns_self(self):
-        """attrs() should return self for chaining"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
-        builder = ElementBuilder(schema_info)
-
-        result = builder.element("Test").attrs({"key": "value"})
-
-        assert result is builder
-
-    def test_child_returns_self(self):
-        """child() should return self for chaining"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
+    def test_full_chain_returns_self(self):
+        """Every fluent step should return the builder itself"""
         # Use non-strict mode for empty schema
-        builder = ElementBuilder(schema_info, strict=False)
-        child_elem = Element("Child")
-
-        result = builder.element("Test").child(child_elem)
-
-        assert result is builder
+        builder = ElementBuilder(_EMPTY_SCHEMA, strict=False)
+
+        b = builder.element("Test")
+        assert b is builder
+        b = b.attr("key", "value")
+        assert b is builder
+        b = b.attrs({"a": "b"})
+        assert b is builder
+        b = b.child(Element("Child"))
+        assert b is builder
+        b = b.children([Element("Child"), Element("Child")])
+        assert b is builder
+        b = b.reset()
+        assert b is builder
 
 
 class TestElementBuilderWithoutElement:
@@ -379,14 +307,7 @@ class TestElementBuilderWithoutElement:
 
     def test_is_child_allowed_without_element(self):
         """Should raise error if checking child without setting element"""
-        schema_info = SchemaInfo(
-            elements={},
-            groups={},
-            root_elements=[],
-            element_hierarchy={},
-            simple_type_definitions={},
-        )
-        builder = ElementBuilder(schema_info)
+        builder = ElementBuilder(_EMPTY_SCHEMA)
 
         with pytest.raises(ValueError, match="tag must be set"):
             builder.is_child_allowed("Child")
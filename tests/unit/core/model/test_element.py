@@ -3,6 +3,7 @@ Unit tests for core model implementations
 Tests Element and ElementMetadata classes
 """
 
+import sys
 import pytest
 from datetime import datetime
 from openscenario_builder.core.model.element import Element, ElementMetadata
@@ -55,6 +56,34 @@ class TestElementMetadata:
         _ = metadata.tags
         _ = metadata.validation_errors
 
+    def test_default_lists_are_per_instance(self):
+        """Should give each metadata its own tags and validation error lists"""
+        first = ElementMetadata()
+        second = ElementMetadata()
+
+        first.tags.append("tag")
+        first.validation_errors.append("error")
+
+        assert first.tags == ["tag"]
+        assert first.validation_errors == ["error"]
+        assert second.tags == []
+        assert second.validation_errors == []
+
+    def test_copy_is_independent(self):
+        """Should copy all fields into new lists"""
+        metadata = ElementMetadata(
+            created_by="user", tags=["a"], validation_errors=["error"]
+        )
+
+        copy = metadata.copy()
+        copy.tags.append("b")
+        copy.validation_errors.clear()
+
+        assert copy.created_at == metadata.created_at
+        assert copy.created_by == "user"
+        assert metadata.tags == ["a"]
+        assert metadata.validation_errors == ["error"]
+
     def test_modified_at_is_settable(self):
         """modified_at should have a setter"""
         metadata = ElementMetadata()
@@ -77,6 +106,39 @@ class TestElement:
         assert element.children == []
         assert isinstance(element.metadata, IElementMetadata)
 
+    def test_elements_without_attributes_stay_independent(self):
+        """Should give an element its own attributes on first set_attribute"""
+        first = Element("First")
+        second = Element("Second", {})
+
+        first.set_attribute("name", "value")
+
+        assert first.attrs == {"name": "value"}
+        assert second.attrs == {}
+        assert second.to_dict()["attrs"] == {}
+
+    @pytest.mark.parametrize("attrs", [None, {"other": "value"}])
+    def test_attrs_writes_always_rejected(self, attrs):
+        """Should reject writes through attrs with or without attributes"""
+        element = Element("TestElement", attrs)
+
+        with pytest.raises(TypeError):
+            element.attrs["name"] = "value"
+        assert not element.has_attribute("name")
+
+    def test_attrs_is_read_only_view(self):
+        """Should reject writes through attrs so attrs_text never goes stale"""
+        element = Element("TestElement", {"x": "1"})
+        view = element.attrs
+        assert element.attrs_text == 'x="1"'
+
+        with pytest.raises(TypeError):
+            element.attrs["x"] = "2"
+        element.set_attribute("x", "2")
+
+        assert view["x"] == "2"
+        assert element.attrs_text == 'x="2"'
+
     def test_create_element_with_attributes(self):
         """Should create element with attributes"""
         attrs = {"attr1": "value1", "attr2": "value2"}
@@ -87,6 +149,50 @@ class TestElement:
         assert element.get_attribute("attr1") == "value1"
         assert element.get_attribute("attr2") == "value2"
 
+    def test_tag_is_interned(self):
+        """Should intern the tag so equal tags share one string object"""
+        tag = "".join(["Test", "Element"])
+        element = Element(tag)
+
+        assert element.tag is sys.intern("TestElement")
+
+    def test_attribute_names_are_interned(self):
+        """Should intern attribute names given at construction and when set"""
+        element = Element("TestElement", {"".join(["na", "me"]): "value"})
+        element.set_attribute("".join(["ty", "pe"]), "car")
+
+        names = list(element.attrs)
+        assert names[0] is sys.intern("name")
+        assert names[1] is sys.intern("type")
+
+    def test_edits_stamp_modified_at(self):
+        """Should record edits in metadata created on demand"""
+        element = Element("TestElement")
+        before = datetime.now()
+
+        element.set_attribute("name", "value")
+
+        assert element.metadata.modified_at >= before
+        assert element.metadata.created_at <= element.metadata.modified_at
+
+    def test_equality_is_identity(self):
+        """Should compare and hash elements by identity, not by content"""
+        first = Element("Child", {"id": "1"})
+        second = Element("Child", {"id": "1"})
+
+        assert first != second
+        assert first in [second, first]
+        assert len({first, second, first}) == 2
+
+    def test_element_has_no_instance_dict(self):
+        """Should store element and metadata state in slots"""
+        element = Element("TestElement")
+
+        assert not hasattr(element, "__dict__")
+        assert not hasattr(element.metadata, "__dict__")
+        with pytest.raises(AttributeError):
+            element.unknown = "value"
+
     def test_create_element_with_children(self):
         """Should create element with children"""
         child1 = Element("Child1")
@@ -180,6 +286,54 @@ class TestElement:
         assert child3 in results
         assert child2 not in results
 
+    def test_children_by_tag_follow_document_order(self):
+        """Should keep tag lookups in document order after inserts and removals"""
+        first = Element("Child")
+        second = Element("Child")
+        parent = Element("Parent", children=[Element("Other"), second])
+
+        parent.insert_child(0, first)
+        parent.add_child(Element("Other"))
+        parent.remove_child(second)
+
+        assert parent.get_child_by_tag("Child") is first
+        assert parent.get_children_by_tag("Child") == [first]
+        assert len(parent.get_children_by_tag("Other")) == 2
+
+    def test_tag_lookup_after_removing_last_child(self):
+        """Should find nothing once the last child of a tag is removed"""
+        parent = Element("Parent")
+        child = Element("Child")
+        parent.add_child(child)
+
+        parent.remove_child(child)
+
+        assert parent.get_child_by_tag("Child") is None
+        assert parent.get_children_by_tag("Child") == []
+
+        parent.add_child(child)
+        assert parent.get_child_by_tag("Child") is child
+
+    def test_get_children_by_tag_returns_copy(self):
+        """Should not expose the internal tag index"""
+        parent = Element("Parent")
+        parent.add_child(Element("Child"))
+
+        parent.get_children_by_tag("Child").clear()
+
+        assert len(parent.get_children_by_tag("Child")) == 1
+
+    def test_attrs_text_follows_attribute_changes(self):
+        """Should render attributes for display and refresh after changes"""
+        element = Element("Test", {"name": "Ego", "type": "car"})
+
+        assert element.attrs_text == 'name="Ego" type="car"'
+
+        element.set_attribute("name", "Target")
+        element.remove_attribute("type")
+
+        assert element.attrs_text == 'name="Target"'
+
     def test_set_attribute(self):
         """Should set attribute value"""
         element = Element("Test")
@@ -252,6 +406,27 @@ class TestElement:
         assert element.attrs == {"attr": "value"}
         assert element.metadata.created_by == "test"
 
+    def test_from_dict_round_trip(self):
+        """Should rebuild children in order and keep stored timestamps"""
+        original = Element("Root", metadata=ElementMetadata(description="root"))
+        child = Element("Child", {"id": "1"})
+        child.add_child(Element("GrandChild"))
+        original.add_child(child)
+        original.add_child(Element("Other"))
+        original.metadata.modified_at = datetime(2025, 1, 1)
+
+        element = Element.from_dict(original.to_dict())
+
+        assert element.to_dict() == original.to_dict()
+        assert element.get_child_by_tag("Child").get_attribute("id") == "1"
+
+    def test_from_dict_without_metadata(self):
+        """Should use default metadata when the dictionary has none"""
+        element = Element.from_dict({"tag": "Test", "children": [{"tag": "Child"}]})
+
+        assert element.metadata.created_by == ""
+        assert element.get_child_by_tag("Child") is element.children[0]
+
     def test_clone(self):
         """Should create deep copy"""
         original = Element("Test", {"attr": "value"})
@@ -265,6 +440,29 @@ class TestElement:
         assert cloned is not original
         assert cloned.children[0] is not original.children[0]
 
+    def test_clone_copies_attributes_metadata_and_index(self):
+        """Should copy attributes, metadata and the tag index independently"""
+        original = Element(
+            "Test",
+            {"attr": "value"},
+            metadata=ElementMetadata(created_by="user", tags=["a"]),
+        )
+        child = Element("Child")
+        child.add_child(Element("GrandChild"))
+        original.add_child(child)
+
+        cloned = original.clone()
+        cloned.set_attribute("attr", "changed")
+        cloned.metadata.tags.append("b")
+
+        assert original.get_attribute("attr") == "value"
+        assert original.metadata.tags == ["a"]
+        assert cloned.metadata.created_by == "user"
+        assert cloned.metadata.created_at == original.metadata.created_at
+        cloned_child = cloned.get_child_by_tag("Child")
+        assert cloned_child is cloned.children[0]
+        assert cloned_child.get_child_by_tag("GrandChild") is not None
+
     def test_find_elements_by_tag(self):
         """Should find all elements by tag in subtree"""
         root = Element("Root")
@@ -282,6 +480,38 @@ class TestElement:
         assert child1 in results
         assert grandchild in results
 
+    def test_find_elements_by_tag_in_deep_tree(self):
+        """Should search trees deeper than the recursion limit"""
+        root = Element("Root")
+        node = root
+        for _ in range(sys.getrecursionlimit() + 100):
+            child = Element("Level")
+            node.add_child(child)
+            node = child
+        node.add_child(Element("Target"))
+
+        results = root.find_elements_by_tag("Target")
+
+        assert [element.tag for element in results] == ["Target"]
+
+    def test_find_elements_by_tags(self):
+        """Should find elements for several tags in one pass, in document order"""
+        root = Element("Root")
+        first = Element("Target")
+        other = Element("Other")
+        nested = Element("Target")
+        root.add_child(first)
+        root.add_child(other)
+        other.add_child(nested)
+        root.add_child(Element("Target"))
+
+        results = root.find_elements_by_tags(["Target", "Other", "Missing"])
+
+        assert results["Target"] == root.find_elements_by_tag("Target")
+        assert results["Target"][:2] == [first, nested]
+        assert results["Other"] == [other]
+        assert results["Missing"] == []
+
     def test_to_xml_string(self):
         """Should convert to XML string"""
         element = Element("Test", {"attr": "value"})
@@ -293,6 +523,34 @@ class TestElement:
         assert "attr" in xml_str
         assert "value" in xml_str
 
+    def test_to_xml_string_pretty_format(self):
+        """Should indent children and keep the XML declaration"""
+        element = Element("Root", {"name": "a & b"})
+        child = Element("Child")
+        child.add_child(Element("Leaf", {"value": "1"}))
+        element.add_child(child)
+
+        xml_str = element.to_xml_string()
+
+        assert xml_str == (
+            '<?xml version="1.0" ?>\n'
+            '<Root name="a &amp; b">\n'
+            "  <Child>\n"
+            '    <Leaf value="1"/>\n'
+            "  </Child>\n"
+            "</Root>"
+        )
+
+    def test_to_xml_string_escapes_whitespace_in_attributes(self):
+        """Should write tab, CR and LF in attribute values as character references"""
+        element = Element("Root", {"text": "a\tb\nc\rd"})
+
+        pretty = element.to_xml_string()
+        compact = element.to_xml_string(pretty=False)
+
+        assert '<Root text="a&#09;b&#10;c&#13;d"/>' in pretty
+        assert compact == '<Root text="a&#09;b&#10;c&#13;d" />'
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
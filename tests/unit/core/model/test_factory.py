@@ -8,17 +8,13 @@ NOTE: These tests require ElementFactory from the schema-aware creation branch.
 
 import pytest
 
-# Try to import, skip all tests if not available
-try:
-    from openscenario_builder.core.model.element_factory import ElementFactory
-
-    FACTORY_AVAILABLE = True
-except ImportError:
-    FACTORY_AVAILABLE = False
-    pytestmark = pytest.mark.skip(reason="ElementFactory not available on this branch")
-from openscenario_builder.core.schema.parser import (
-    AttributeDefinition,
-    ChildElementInfo,
+# Skip the whole module if ElementFactory is not available
+ElementFactory = pytest.importorskip(
+    "openscenario_builder.core.model.element_factory"
+).ElementFactory
+
+from openscenario_builder.core.model.element import Element  # noqa: E402
+from openscenario_builder.core.schema.parser import (  # noqa: E402
     ElementDefinition,
     SchemaInfo,
 )
@@ -27,40 +23,6 @@ from openscenario_builder.core.schema.parser import (
 class TestElementFactory:
     """Test ElementFactory schema-aware creation"""
 
-    @pytest.fixture
-    def simple_schema(self):
-        """Create a simple test schema"""
-        # Define Parent element with required attributes
-        parent_attrs = [
-            AttributeDefinition("name", "string", True),
-            AttributeDefinition("version", "string", False),
-        ]
-        parent_def = ElementDefinition(
-            name="Parent",
-            attributes=parent_attrs,
-            children=["Child"],
-            child_occurrence_info={
-                "Child": ChildElementInfo("Child", min_occur=1, max_occur="unbounded")
-            },
-        )
-
-        # Define Child element
-        child_attrs = [
-            AttributeDefinition("id", "string", True),
-            AttributeDefinition("value", "double", False),
-        ]
-        child_def = ElementDefinition(name="Child", attributes=child_attrs, children=[])
-
-        schema_info = SchemaInfo(
-            elements={"Parent": parent_def, "Child": child_def},
-            groups={},
-            root_elements=["Parent"],
-            element_hierarchy={"Parent": ["Child"]},
-            simple_type_definitions={},
-        )
-
-        return schema_info
-
     def test_create_factory_with_schema(self, simple_schema):
         """Should create factory with schema"""
         factory = ElementFactory(simple_schema)
@@ -154,6 +116,16 @@ class TestElementFactory:
         assert "name" in required
         assert "version" not in required
 
+    def test_attribute_lists_are_copies(self, simple_schema):
+        """Mutating a returned attribute list should not affect later calls"""
+        factory = ElementFactory(simple_schema)
+
+        factory.get_required_attributes("Parent").append("extra")
+        factory.get_optional_attributes("Parent").clear()
+
+        assert factory.get_required_attributes("Parent") == ["name"]
+        assert factory.get_optional_attributes("Parent") == ["version"]
+
     def test_get_allowed_children(self, simple_schema):
         """Should get allowed children for element"""
         factory = ElementFactory(simple_schema)
@@ -195,6 +167,45 @@ class TestElementFactory:
         errors = factory.get_validation_errors(element)
         assert len(errors) > 0
 
+    def test_validation_errors_stored_in_metadata(self, simple_schema):
+        """Should keep permissive-mode errors on the element itself"""
+        factory = ElementFactory(simple_schema, strict=False)
+
+        invalid = factory.create("Unknown", {})
+        valid = factory.create("Child", {"id": "1"})
+
+        assert invalid.metadata.validation_errors == factory.get_validation_errors(
+            invalid
+        )
+        assert factory.get_validation_errors(valid) == []
+
+    def test_validation_errors_for_foreign_element(self, simple_schema):
+        """Should not create metadata for elements without recorded errors"""
+        factory = ElementFactory(simple_schema, strict=False)
+        element = Element("Unknown")
+
+        assert factory.get_validation_errors(element) == []
+        assert element._metadata is None
+
+    def test_validation_errors_returned_as_copy(self, simple_schema):
+        """Mutating the returned errors should not change the stored ones"""
+        factory = ElementFactory(simple_schema, strict=False)
+        element = factory.create("Unknown", {})
+
+        factory.get_validation_errors(element).clear()
+
+        assert factory.get_validation_errors(element) != []
+
+    def test_clone_drops_creation_errors(self, simple_schema):
+        """Clones should not carry the original's creation errors"""
+        factory = ElementFactory(simple_schema, strict=False)
+        element = factory.create("Unknown", {})
+
+        clone = element.clone()
+
+        assert factory.get_validation_errors(clone) == []
+        assert factory.get_validation_errors(element) != []
+
 
 class TestElementFactoryEdgeCases:
     """Test edge cases and error conditions"""
@@ -0,0 +1,103 @@
+"""
+Unit tests for XOSC Schema Validator Compiler
+Tests SchemaValidatorCompiler
+"""
+
+import pytest
+from openscenario_builder.core.utils.validators import SchemaValidatorCompiler
+from openscenario_builder.core.utils.validators.schema_validator_compiler import (
+    OP_ATTRIBUTE,
+    OP_CHILDREN,
+    OP_UNKNOWN_ATTRIBUTES,
+)
+from openscenario_builder.core.model.element import Element
+from openscenario_builder.core.schema.parser import (
+    SchemaInfo,
+    ElementDefinition,
+    AttributeDefinition,
+    GroupDefinition,
+)
+
+
+class TestSchemaValidatorCompiler:
+    """Test Schema Validator Compiler"""
+
+    @pytest.fixture
+    def schema_info(self):
+        """Schema with attributes, enumerations and a group reference"""
+        return SchemaInfo(
+            elements={
+                "Parent": ElementDefinition(
+                    name="Parent",
+                    attributes=[
+                        AttributeDefinition("name", "string", True),
+                        AttributeDefinition("count", "int", False),
+                        AttributeDefinition("mode", "string", False),
+                    ],
+                    children=["GROUP:ChildGroup"],
+                ),
+                "Child": ElementDefinition("Child", [], []),
+            },
+            groups={"ChildGroup": GroupDefinition("ChildGroup", ["Child"])},
+            root_elements=["Parent"],
+            element_hierarchy={},
+            simple_type_definitions={"Mode": ["fast", "slow"]},
+        )
+
+    def test_compile_returns_check_per_element(self, schema_info):
+        """Should compile one check function per element definition"""
+        compiled = SchemaValidatorCompiler.compile(schema_info)
+
+        assert set(compiled.keys()) == {"Parent", "Child"}
+        assert all(callable(check) for check in compiled.values())
+
+    def test_compile_ops_in_report_order(self, schema_info):
+        """Should emit one op per check in the order errors are reported"""
+        ops = SchemaValidatorCompiler.compile_ops(
+            schema_info.elements["Parent"], schema_info
+        )
+
+        assert [op[0] for op in ops] == [
+            OP_UNKNOWN_ATTRIBUTES,
+            OP_ATTRIBUTE,
+            OP_ATTRIBUTE,
+            OP_ATTRIBUTE,
+            OP_CHILDREN,
+        ]
+        assert [op[1] for op in ops[1:4]] == ["name", "count", "mode"]
+        assert ops[-1][1] == frozenset({"Child"})
+
+    def test_compile_is_cached_per_schema(self, schema_info):
+        """Should reuse compiled checks for the same schema"""
+        first = SchemaValidatorCompiler.compile(schema_info)
+        second = SchemaValidatorCompiler.compile(schema_info)
+
+        assert first is second
+
+    def test_compiled_check_valid_element(self, schema_info):
+        """Should not return errors for a valid element"""
+        element = Element("Parent", {"name": "p", "count": "$count", "mode": "fast"})
+        element.add_child(Element("Child"))
+
+        check = SchemaValidatorCompiler.compile(schema_info)["Parent"]
+
+        assert check(element) == []
+
+    def test_compiled_check_reports_errors_in_order(self, schema_info):
+        """Should report attribute errors before child structure errors"""
+        element = Element("Parent", {"bogus": "x", "count": "abc", "mode": "medium"})
+        element.add_child(Element("Other"))
+
+        check = SchemaValidatorCompiler.compile(schema_info)["Parent"]
+        errors = check(element)
+
+        assert [error.split(":")[0] for error in errors] == [
+            "ATTRIBUTE_ERROR",
+            "REQUIRED_ATTRIBUTE_ERROR",
+            "TYPE_ERROR",
+            "VALUE_ERROR",
+            "STRUCTURE_ERROR",
+        ]
+        assert "Valid attributes for 'Parent': name, count, mode" in errors[0]
+        assert "Valid values: fast, slow" in errors[3]
+        assert "Valid child elements for 'Parent': Child" in errors[4]
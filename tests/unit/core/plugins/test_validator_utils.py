@@ -117,6 +117,18 @@ class TestValidationUtils:
             ValidationUtils.validate_attribute_type("$123", "int") is False
         )  # Invalid pattern
 
+    def test_validate_attribute_type_caches_results(self):
+        """Should answer repeated checks from the cache"""
+        validate = ValidationUtils.validate_attribute_type
+        validate.cache_clear()
+
+        assert validate("3.14", "int") is False
+        assert validate("3.14", "int") is False
+        assert validate("3.14", "double") is True
+
+        info = validate.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
     def test_get_type_validation_hint(self):
         """Should return appropriate hints for types"""
         assert "decimal" in ValidationUtils.get_type_validation_hint("double")
@@ -181,6 +193,44 @@ class TestValidationUtils:
         assert "Element2" in result
         assert "Element3" in result
 
+    def test_expand_children_with_groups_cyclic(self):
+        """Should terminate on groups that reference each other"""
+        groups = {
+            "GroupA": MockGroupDefinition(["Element1", "GROUP:GroupB"]),
+            "GroupB": MockGroupDefinition(["GROUP:GroupA", "Element2"]),
+        }
+        schema_info = SchemaInfo(
+            elements={},
+            groups=groups,
+            root_elements=[],
+            element_hierarchy={},
+            simple_type_definitions={},
+        )
+
+        result = ValidationUtils.expand_children_with_groups(
+            ["GROUP:GroupA", "Element3"], schema_info
+        )
+
+        assert result == ["Element1", "Element2", "Element3"]
+
+    def test_expand_children_with_groups_cached_copies(self):
+        """Should reuse the expansion but return an independent list"""
+        groups = {"TestGroup": MockGroupDefinition(["Element1", "Element2"])}
+        schema_info = SchemaInfo(
+            elements={},
+            groups=groups,
+            root_elements=[],
+            element_hierarchy={},
+            simple_type_definitions={},
+        )
+        children = ["GROUP:TestGroup", "Element3"]
+
+        first = ValidationUtils.expand_children_with_groups(children, schema_info)
+        first.append("Extra")
+        second = ValidationUtils.expand_children_with_groups(children, schema_info)
+
+        assert second == ["Element1", "Element2", "Element3"]
+
 
 class TestElementCollector:
     """Test ElementCollector class"""
@@ -212,6 +262,20 @@ class TestElementCollector:
         assert len(result) == 1
         assert "nested" in result
 
+    def test_collect_by_tags_last_duplicate_wins(self):
+        """Should keep the last element in document order for a repeated name"""
+        root = Element("Root")
+        container = Element("Container")
+        first = Element("Target", {"name": "dup"})
+        last = Element("Target", {"name": "dup"})
+        root.add_child(container)
+        container.add_child(first)
+        root.add_child(last)
+
+        result = ElementCollector.collect_by_tags(root, ["Target"])
+
+        assert result["dup"] is last
+
     def test_collect_by_tags_multiple_tags(self):
         """Should collect elements with any of the specified tags"""
         root = Element("Root")
@@ -294,6 +358,25 @@ class TestElementCollector:
         assert "Controller1" in controllers
         assert "Signal1" in signals
 
+    def test_collect_all_single_pass(self):
+        """Should fill every bucket from one walk of the tree"""
+        root = Element("Root")
+        entity = Element("Vehicle", {"name": "Car1"})
+        param = Element("ParameterDeclaration", {"name": "InitSpeed"})
+        act = Element("Act", {"name": "Act1"})
+        signal = Element("TrafficSignal", {"id": "Signal1"})
+        for child in (entity, param, act, signal):
+            root.add_child(child)
+
+        result = ElementCollector.collect_all(root)
+
+        assert result["entities"] == {"Car1": entity}
+        assert result["variables"] == {}
+        assert result["parameters"] == {"InitSpeed": param}
+        assert result["storyboard_elements"] == {"Act1": act}
+        assert result["traffic_controllers"] == {}
+        assert result["traffic_signals"] == {"Signal1": signal}
+
     def test_collect_elements_without_names(self):
         """Should skip elements without name attributes"""
         root = Element("Root")
@@ -0,0 +1,119 @@
+"""
+Unit tests for XOSC Fused Validator
+Tests FusedXoscValidator against the individual validators it combines
+"""
+
+import pytest
+from openscenario_builder.core.utils.validators import (
+    FusedXoscValidator,
+    XoscSchemaStructureValidator,
+    XoscSequenceOrderValidator,
+    XoscStructureValidator,
+    XoscUniquenessValidator,
+)
+from openscenario_builder.core.model.element import Element
+from openscenario_builder.core.schema.parser import (
+    SchemaInfo,
+    ElementDefinition,
+    AttributeDefinition,
+)
+
+
+@pytest.fixture
+def schema_info():
+    """Small schema with a sequence content model"""
+    return SchemaInfo(
+        elements={
+            "OpenSCENARIO": ElementDefinition(
+                name="OpenSCENARIO",
+                attributes=[],
+                children=["FileHeader", "Entities"],
+                content_model_type="sequence",
+            ),
+            "FileHeader": ElementDefinition(
+                name="FileHeader",
+                attributes=[
+                    AttributeDefinition("revMajor", "unsignedShort", True),
+                    AttributeDefinition("revMinor", "unsignedShort", True),
+                    AttributeDefinition("date", "dateTime", True),
+                    AttributeDefinition("description", "string", True),
+                ],
+                children=[],
+            ),
+            "Entities": ElementDefinition(
+                name="Entities",
+                attributes=[],
+                children=["ScenarioObject"],
+            ),
+            "ScenarioObject": ElementDefinition(
+                name="ScenarioObject",
+                attributes=[AttributeDefinition("name", "string", True)],
+                children=[],
+            ),
+        },
+        groups={},
+        root_elements=["OpenSCENARIO"],
+        element_hierarchy={},
+        simple_type_definitions={},
+    )
+
+
+@pytest.fixture
+def invalid_scenario():
+    """Scenario with schema, structure, sequence and uniqueness errors"""
+    root = Element("OpenSCENARIO")
+    entities = Element("Entities")
+    entities.add_child(Element("ScenarioObject", {"name": "Ego"}))
+    entities.add_child(Element("ScenarioObject", {"name": "Ego"}))
+    entities.add_child(Element("Unknown"))
+    root.add_child(entities)
+    root.add_child(Element("FileHeader", {"revMajor": "x"}))
+    return root
+
+
+class TestFusedXoscValidator:
+    """Test Fused Validator"""
+
+    def _individual_errors(self, element, schema_info):
+        errors = []
+        errors.extend(XoscSchemaStructureValidator().validate(element, schema_info))
+        errors.extend(XoscStructureValidator().validate(element, schema_info))
+        errors.extend(XoscSequenceOrderValidator().validate(element, schema_info))
+        errors.extend(XoscUniquenessValidator().validate(element, schema_info))
+        return errors
+
+    def test_matches_individual_validators(self, schema_info, invalid_scenario):
+        """Should produce the same errors in the same order as separate passes"""
+        validator = FusedXoscValidator()
+
+        errors = validator.validate(invalid_scenario, schema_info)
+
+        assert errors == self._individual_errors(invalid_scenario, schema_info)
+        assert any("SCHEMA_ERROR" in e for e in errors)
+        assert any("SEQUENCE_ORDER_ERROR" in e for e in errors)
+        assert any("UNIQUENESS_ERROR" in e for e in errors)
+
+    def test_errors_grouped_by_validator(self, schema_info, invalid_scenario):
+        """Should tag errors with the validator that produced them"""
+        validator = FusedXoscValidator()
+
+        results = validator.validate_by_validator(invalid_scenario, schema_info)
+
+        assert list(results.keys()) == list(FusedXoscValidator.VALIDATOR_ORDER)
+        assert all(
+            "UNIQUENESS_ERROR" in e for e in results[FusedXoscValidator.UNIQUENESS]
+        )
+        assert all(
+            "SEQUENCE_ORDER_ERROR" in e
+            for e in results[FusedXoscValidator.SEQUENCE_ORDER]
+        )
+
+    def test_validate_without_schema_info(self, invalid_scenario):
+        """Should report configuration errors but still run schema-free checks"""
+        validator = FusedXoscValidator()
+
+        errors = validator.validate(invalid_scenario, None)
+
+        assert errors == self._individual_errors(invalid_scenario, None)
+        assert sum("CONFIGURATION_ERROR" in e for e in errors) == 2
+        assert any("UNIQUENESS_ERROR" in e for e in errors)
@@ -26,6 +26,12 @@ class TestXoscScenarioValidatorPlugin:
         assert validator.metadata.version == "3.2.0"
         assert validator.metadata.tags and "comprehensive" in validator.metadata.tags
 
+    def test_plugin_metadata_is_cached(self):
+        """Should build the metadata once per plugin instance"""
+        validator = XoscScenarioValidatorPlugin()
+
+        assert validator.metadata is validator.metadata
+
     def test_activation_state(self):
         """Should support activation control"""
         validator = XoscScenarioValidatorPlugin()
@@ -46,6 +46,29 @@ class TestXoscSchemaStructureValidator:
         assert "SCHEMA_ERROR" in errors[0]
         assert "UnknownElement" in errors[0]
 
+    def test_validate_unknown_element_skips_subtree(self):
+        """Should not validate the children of an unknown element"""
+        validator = XoscSchemaStructureValidator()
+        parent = Element("UnknownElement")
+        parent.add_child(Element("AnotherUnknown"))
+        parent.add_child(Element("TestElement", {"bogus": "x"}))
+
+        elem_def = ElementDefinition(name="TestElement", attributes=[], children=[])
+        schema_info = SchemaInfo(
+            elements={"TestElement": elem_def},
+            groups={},
+            root_elements=[],
+            element_hierarchy={},
+            simple_type_definitions={},
+        )
+
+        errors = validator.validate(parent, schema_info)
+
+        assert len(errors) == 1
+        assert "SCHEMA_ERROR" in errors[0]
+        assert "Subtree skipped" in errors[0]
+        assert "2 child element(s)" in errors[0]
+
     def test_validate_known_element(self):
         """Should not return error for known element"""
         validator = XoscSchemaStructureValidator()
@@ -216,6 +239,32 @@ class TestXoscSchemaStructureValidator:
         assert "VALUE_ERROR" in errors[0]
         assert "unknown" in errors[0]
 
+    def test_validate_enumerated_attribute_case_insensitive_type_name(self):
+        """Should match simple type names case-insensitively"""
+        validator = XoscSchemaStructureValidator()
+        element = Element("TestElement", {"rule": "sideways"})
+
+        elem_def = ElementDefinition(
+            name="TestElement",
+            attributes=[
+                AttributeDefinition(name="rule", type="string", required=False)
+            ],
+            children=[],
+        )
+        schema_info = SchemaInfo(
+            elements={"TestElement": elem_def},
+            groups={},
+            root_elements=[],
+            element_hierarchy={},
+            simple_type_definitions={"Rule": ["greaterThan", "lessThan"]},
+        )
+
+        errors = validator.validate(element, schema_info)
+
+        assert len(errors) == 1
+        assert "VALUE_ERROR" in errors[0]
+        assert "greaterThan, lessThan" in errors[0]
+
     def test_validate_invalid_child_element(self):
         """Should return error for invalid child element"""
         validator = XoscSchemaStructureValidator()
@@ -563,3 +563,40 @@ class TestXoscSequenceOrderValidator:
         assert any(
             "ManeuverGroup" in error or "StartTrigger" in error for error in errors
         )
+
+    def test_validate_cyclic_group_references(self):
+        """Should terminate when choice groups reference each other"""
+        validator = XoscSequenceOrderValidator()
+
+        parent = Element("Parent")
+        parent.add_child(Element("First"))
+        parent.add_child(Element("Second"))
+
+        parent_def = ElementDefinition(
+            name="Parent",
+            attributes=[],
+            children=["GROUP:ChoiceA"],
+            content_model_type="sequence",
+        )
+        schema_info = SchemaInfo(
+            elements={
+                "Parent": parent_def,
+                "First": ElementDefinition(name="First", attributes=[], children=[]),
+                "Second": ElementDefinition(name="Second", attributes=[], children=[]),
+            },
+            groups={
+                "ChoiceA": GroupDefinition(
+                    name="ChoiceA", children=["First", "GROUP:ChoiceB"], is_choice=True
+                ),
+                "ChoiceB": GroupDefinition(
+                    name="ChoiceB", children=["GROUP:ChoiceA", "Second"], is_choice=True
+                ),
+            },
+            root_elements=["Parent"],
+            element_hierarchy={},
+            simple_type_definitions={},
+        )
+
+        errors = validator.validate(parent, schema_info)
+
+        assert errors == []
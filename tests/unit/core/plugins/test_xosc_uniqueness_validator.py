@@ -193,6 +193,19 @@ class TestXoscUniquenessValidator:
 
         assert len(errors) == 0
 
+    def test_validate_duplicates_reported_in_first_occurrence_order(self):
+        """Should report duplicate names in the order they first appear"""
+        validator = XoscUniquenessValidator()
+        root = Element("Root")
+        for name in ["first", "second", "second", "first"]:
+            root.add_child(Element("Child", {"name": name}))
+
+        errors = validator.validate(root)
+
+        assert len(errors) == 2
+        assert "'first'" in errors[0]
+        assert "'second'" in errors[1]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -41,6 +41,15 @@ class TestAttributeDefinition:
 
         assert attr_def.required is False
 
+    def test_equal_definitions_hash_alike(self):
+        """Definitions with the same fields should be equal and hashable"""
+        attr_def = AttributeDefinition("testAttr", "string", True)
+        same = AttributeDefinition("testAttr", "string", True)
+
+        assert attr_def == same
+        assert hash(attr_def) == hash(same)
+        assert attr_def != AttributeDefinition("testAttr", "string", False)
+
 
 class TestChildElementInfo:
     """Test ChildElementInfo implementation"""
@@ -63,6 +72,13 @@ class TestChildElementInfo:
         assert child_info.min_occur == 0
         assert child_info.max_occur == "unbounded"
 
+    def test_equal_infos_hash_alike(self):
+        """Infos with the same fields should be equal and hashable"""
+        child_info = ChildElementInfo("ChildElement", min_occur=0)
+
+        assert child_info == ChildElementInfo("ChildElement", min_occur=0)
+        assert len({child_info, ChildElementInfo("ChildElement", min_occur=0)}) == 1
+
 
 class TestElementDefinition:
     """Test ElementDefinition implementation"""
@@ -140,6 +156,27 @@ class TestElementDefinition:
         element_def.is_root = True
         assert element_def.is_root is True
 
+    def test_attr_names_set(self):
+        """Should expose attribute names as a frozenset"""
+        element_def = ElementDefinition(
+            name="TestElement",
+            attributes=[
+                AttributeDefinition("name", "string", True),
+                AttributeDefinition("value", "double", False),
+            ],
+            children=[],
+        )
+
+        assert element_def.attr_names_set == frozenset({"name", "value"})
+
+    def test_children_set(self):
+        """Should expose child names as a frozenset"""
+        element_def = ElementDefinition(
+            name="TestElement", attributes=[], children=["Child1", "GROUP:G"]
+        )
+
+        assert element_def.children_set == frozenset({"Child1", "GROUP:G"})
+
 
 class TestGroupDefinition:
     """Test GroupDefinition implementation"""
@@ -319,6 +319,25 @@ class TestInterfaceImplementation:
         validator.activated = False
         assert validator.activated is False
 
+    def test_plugin_activated_by_default(self):
+        """Plugins should be activated by default without implementing it"""
+
+        class TestValidator(IValidatorPlugin):
+            metadata = None
+
+            def validate(self, element: IElement, schema_info=None) -> List[str]:
+                return []
+
+            def get_name(self) -> str:
+                return "Test Validator"
+
+        first = TestValidator()
+        second = TestValidator()
+        first.activated = False
+
+        assert first.activated is False
+        assert second.activated is True
+
 
 class TestInterfaceInheritance:
     """Test interface inheritance relationships"""
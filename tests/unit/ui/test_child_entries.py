@@ -0,0 +1,99 @@
+"""
+Unit tests for child entries
+Tests resolution of allowed children and GROUP: references into menu entries
+
+NOTE: The module itself does not use Qt, but importing the ui package does;
+      these tests are skipped if PySide6 is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from openscenario_builder.core.schema.parser import GroupDefinition  # noqa: E402
+from openscenario_builder.ui.qt.child_entries import (  # noqa: E402
+    ENTRY_ELEMENT,
+    ENTRY_GROUP,
+    ENTRY_MISSING_GROUP,
+    resolve_children,
+    resolve_groups,
+)
+
+
+def _groups(**children):
+    """Build group definitions keyed by name, in keyword order"""
+    return {name: GroupDefinition(name, names) for name, names in children.items()}
+
+
+class TestResolveGroups:
+    """Test resolve_groups"""
+
+    def test_nested_groups(self):
+        """Should nest the entries of referenced groups"""
+        resolved = resolve_groups(
+            _groups(Outer=["GROUP:Inner", "Element3"], Inner=["Element1"])
+        )
+
+        assert resolved["Inner"] == ((ENTRY_ELEMENT, "Element1", ()),)
+        assert resolved["Outer"] == (
+            (ENTRY_GROUP, "Inner", resolved["Inner"]),
+            (ENTRY_ELEMENT, "Element3", ()),
+        )
+
+    def test_missing_group(self):
+        """Should keep references to undefined groups as missing entries"""
+        resolved = resolve_groups(_groups(Outer=["GROUP:Missing"]))
+
+        assert resolved["Outer"] == ((ENTRY_MISSING_GROUP, "Missing", ()),)
+
+    def test_referencing_groups_share_entries(self):
+        """Should resolve a group once and share it between referencing groups"""
+        resolved = resolve_groups(
+            _groups(First=["GROUP:Shared"], Second=["GROUP:Shared"], Shared=["A"])
+        )
+
+        first = resolved["First"][0][2]
+        second = resolved["Second"][0][2]
+        assert first is second is resolved["Shared"]
+
+    def test_cyclic_groups_truncate_later_group(self):
+        """Should drop the back reference from the group listed later"""
+        resolved = resolve_groups(
+            _groups(A=["ElementA", "GROUP:B"], B=["GROUP:A", "ElementB"])
+        )
+
+        assert resolved["B"] == ((ENTRY_ELEMENT, "ElementB", ()),)
+        assert resolved["A"] == (
+            (ENTRY_ELEMENT, "ElementA", ()),
+            (ENTRY_GROUP, "B", resolved["B"]),
+        )
+
+
+class TestResolveChildren:
+    """Test resolve_children"""
+
+    def test_children_with_groups(self):
+        """Should resolve element names and group references in order"""
+        resolved = resolve_groups(_groups(Group=["Element1"]))
+
+        entries = resolve_children(
+            ["Element0", "GROUP:Group", "GROUP:Missing"], resolved
+        )
+
+        assert entries == (
+            (ENTRY_ELEMENT, "Element0", ()),
+            (ENTRY_GROUP, "Group", resolved["Group"]),
+            (ENTRY_MISSING_GROUP, "Missing", ()),
+        )
+
+    def test_cyclic_group_referenced_from_children(self):
+        """Should offer both groups of a cycle at the top level"""
+        resolved = resolve_groups(_groups(A=["GROUP:B"], B=["GROUP:A"]))
+
+        entries = resolve_children(["GROUP:A", "GROUP:B"], resolved)
+
+        assert [entry[1] for entry in entries] == ["A", "B"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
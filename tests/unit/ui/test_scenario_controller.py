@@ -0,0 +1,175 @@
+"""
+Unit tests for ScenarioController
+Tests that results of background loads and validations are only applied
+while they are still current
+
+NOTE: These tests require PySide6 and are skipped if it is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication, QThreadPool  # noqa: E402
+
+from openscenario_builder.core.plugins.import_plugin import (  # noqa: E402
+    ImportPlugin,
+)
+from openscenario_builder.core.plugins.plugin_manager import (  # noqa: E402
+    PluginManager,
+)
+from openscenario_builder.core.schema.parser import (  # noqa: E402
+    ElementDefinition,
+    SchemaInfo,
+)
+from openscenario_builder.ui.qt.main_window import (  # noqa: E402
+    ScenarioController,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Core application delivering worker results; needs no display"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def controller(app):
+    """Controller with the XML import plugin and a minimal schema"""
+    schema_info = SchemaInfo(
+        elements={"FileHeader": ElementDefinition("FileHeader", [], [])},
+        groups={},
+        root_elements=[],
+        element_hierarchy={},
+        simple_type_definitions={},
+    )
+    plugin_manager = PluginManager()
+    plugin_manager.register_import_plugin(ImportPlugin())
+    return ScenarioController(schema_info, plugin_manager)
+
+
+def _record(signal):
+    """Collect the arguments of every emission of a signal"""
+    emitted = []
+    signal.connect(lambda *args: emitted.append(args))
+    return emitted
+
+
+def _finish_workers():
+    """Wait for the pool threads and deliver their queued results"""
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.processEvents()
+
+
+def _write_scenario(path, description):
+    """Write a scenario file whose FileHeader carries description"""
+    path.write_text(
+        f'<OpenSCENARIO><FileHeader description="{description}"/></OpenSCENARIO>'
+    )
+    return str(path)
+
+
+class TestScenarioControllerAsync:
+    """Test ordering of background loads and validations"""
+
+    def test_overlapping_loads_apply_only_newest(self, controller, tmp_path):
+        """Should apply only the most recently requested load"""
+        first = _write_scenario(tmp_path / "first.xosc", "first")
+        second = _write_scenario(tmp_path / "second.xosc", "second")
+        loaded = _record(controller.scenario_loaded)
+
+        controller.load_scenario_async(first)
+        controller.load_scenario_async(second)
+        _finish_workers()
+
+        assert loaded == [(second, True)]
+        header = controller.root_element.get_child_by_tag("FileHeader")
+        assert header.get_attribute("description") == "second"
+
+    def test_load_discarded_after_edit(self, controller, tmp_path):
+        """Should not replace a scenario edited while the load ran"""
+        path = _write_scenario(tmp_path / "scenario.xosc", "loaded")
+        controller.create_new_scenario()
+        edited_root = controller.root_element
+        loaded = _record(controller.scenario_loaded)
+        discarded = _record(controller.scenario_load_discarded)
+
+        controller.load_scenario_async(path)
+        controller.add_element("FileHeader")
+        _finish_workers()
+
+        assert loaded == []
+        assert discarded == [(path,)]
+        assert controller.root_element is edited_root
+
+    def test_overlapping_validations_report_only_newest(self, controller):
+        """Should emit errors only for the most recent validation request"""
+        controller.create_new_scenario()
+        reported = _record(controller.validation_errors)
+
+        controller.validate_scenario_async()
+        controller.validate_scenario_async()
+        _finish_workers()
+
+        assert reported == [([],)]
+
+    def test_validation_dropped_after_edit(self, controller):
+        """Should not report errors for a scenario edited meanwhile"""
+        controller.create_new_scenario()
+        reported = _record(controller.validation_errors)
+
+        controller.validate_scenario_async()
+        controller.add_element("FileHeader")
+        _finish_workers()
+
+        assert reported == []
+
+
+class TestScenarioControllerXmlCache:
+    """Test that the serialized scenario follows every edit"""
+
+    def test_xml_reused_without_changes(self, controller):
+        """Should serialize once while the scenario is unchanged"""
+        controller.create_new_scenario()
+        header = controller.add_element("FileHeader")
+        controller.update_element_attributes(header, {"description": "a"})
+
+        xml = controller.get_xml()
+        controller.update_element_attributes(header, {"description": "a"})
+
+        assert controller.get_xml() is xml
+
+    def test_xml_refreshed_after_add(self, controller):
+        """Should include an element added after the last serialization"""
+        controller.create_new_scenario()
+        assert "FileHeader" not in controller.get_xml()
+
+        controller.add_element("FileHeader")
+
+        assert "FileHeader" in controller.get_xml()
+
+    def test_xml_refreshed_after_remove(self, controller):
+        """Should drop an element removed after the last serialization"""
+        controller.create_new_scenario()
+        header = controller.add_element("FileHeader")
+        assert "FileHeader" in controller.get_xml()
+
+        controller.remove_element(header)
+
+        assert "FileHeader" not in controller.get_xml()
+
+    def test_xml_refreshed_after_attribute_update(self, controller):
+        """Should reflect changed attributes in both pretty and compact output"""
+        controller.create_new_scenario()
+        header = controller.add_element("FileHeader")
+        controller.get_xml()
+        controller.get_xml(pretty=False)
+
+        controller.update_element_attributes(header, {"description": "b"})
+
+        assert 'description="b"' in controller.get_xml()
+        assert 'description="b"' in controller.get_xml(pretty=False)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Unit tests for ScenarioTreeModel
+Tests index and parent lookups and the row notifications driven by the
+ScenarioController edit signals
+
+NOTE: These tests require PySide6 and are skipped if it is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QCoreApplication, QModelIndex  # noqa: E402
+
+from openscenario_builder.core.plugins.plugin_manager import (  # noqa: E402
+    PluginManager,
+)
+from openscenario_builder.core.schema.parser import (  # noqa: E402
+    ElementDefinition,
+    SchemaInfo,
+)
+from openscenario_builder.ui.qt.main_window import (  # noqa: E402
+    ScenarioController,
+)
+from openscenario_builder.ui.qt.tree_model import ScenarioTreeModel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Core application for the Qt object system; needs no display"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def controller(app):
+    """Controller with a new scenario and a schema of childless elements"""
+    schema_info = SchemaInfo(
+        elements={
+            name: ElementDefinition(name, [], [])
+            for name in ("FileHeader", "Storyboard", "Story")
+        },
+        groups={},
+        root_elements=[],
+        element_hierarchy={},
+        simple_type_definitions={},
+    )
+    controller = ScenarioController(schema_info, PluginManager())
+    controller.create_new_scenario()
+    return controller
+
+
+@pytest.fixture
+def model(controller):
+    """Model wired to the controller the way the tree widget wires it"""
+    model = ScenarioTreeModel(controller.find_parent)
+    controller.element_about_to_be_added.connect(model.begin_add_child)
+    controller.element_added.connect(model.end_add_child)
+    controller.element_about_to_be_removed.connect(model.begin_remove_child)
+    controller.element_removed.connect(model.end_remove_child)
+    model.set_root_element(controller.root_element)
+    return model
+
+
+def _record(signal):
+    """Collect the arguments of every emission of a row signal"""
+    emitted = []
+    signal.connect(
+        lambda parent, first, last: emitted.append(
+            (parent.internalPointer() if parent.isValid() else None, first, last)
+        )
+    )
+    return emitted
+
+
+class TestScenarioTreeModelIndexes:
+    """Test index, parent and row count lookups"""
+
+    def test_root_is_the_only_top_level_row(self, controller, model):
+        """Test that the scenario root is shown as the single top-level row"""
+        assert model.rowCount(QModelIndex()) == 1
+        index = model.index_for_element(controller.root_element)
+        assert index.row() == 0
+        assert not model.parent(index).isValid()
+
+    def test_index_parent_round_trip(self, controller, model):
+        """Test that the parent of every index is the element's parent"""
+        storyboard = controller.add_element("Storyboard")
+        stories = [controller.add_element("Story", storyboard) for _ in range(3)]
+
+        for row, story in enumerate(stories):
+            index = model.index_for_element(story)
+            assert index.row() == row
+            assert index.internalPointer() is story
+            parent = model.parent(index)
+            assert parent.internalPointer() is storyboard
+            assert model.index(row, 0, parent) == index
+
+    def test_row_count(self, controller, model):
+        """Test that row counts follow the children of each element"""
+        controller.add_element("FileHeader")
+        storyboard = controller.add_element("Storyboard")
+        controller.add_element("Story", storyboard)
+
+        root_index = model.index_for_element(controller.root_element)
+        assert model.rowCount(root_index) == 2
+        assert model.rowCount(model.index_for_element(storyboard)) == 1
+
+    def test_rows_follow_removal_of_earlier_sibling(self, controller, model):
+        """Test that later siblings move up a row after a removal"""
+        storyboard = controller.add_element("Storyboard")
+        stories = [controller.add_element("Story", storyboard) for _ in range(3)]
+        # Build the row lookup before the edit
+        model.index_for_element(stories[2])
+
+        controller.remove_element(stories[0])
+
+        assert model.index_for_element(stories[1]).row() == 0
+        assert model.index_for_element(stories[2]).row() == 1
+
+
+class TestScenarioTreeModelNotifications:
+    """Test row notifications driven by the controller signals"""
+
+    def test_add_element_inserts_row(self, controller, model):
+        """Test that adding an element announces the appended row"""
+        storyboard = controller.add_element("Storyboard")
+        controller.add_element("Story", storyboard)
+        about_to_insert = _record(model.rowsAboutToBeInserted)
+        inserted = _record(model.rowsInserted)
+
+        story = controller.add_element("Story", storyboard)
+
+        assert about_to_insert == [(storyboard, 1, 1)]
+        assert inserted == [(storyboard, 1, 1)]
+        assert model.index_for_element(story).row() == 1
+
+    def test_remove_element_removes_row(self, controller, model):
+        """Test that removing an element announces its row"""
+        storyboard = controller.add_element("Storyboard")
+        stories = [controller.add_element("Story", storyboard) for _ in range(3)]
+        about_to_remove = _record(model.rowsAboutToBeRemoved)
+        removed = _record(model.rowsRemoved)
+
+        controller.remove_element(stories[1])
+
+        assert about_to_remove == [(storyboard, 1, 1)]
+        assert removed == [(storyboard, 1, 1)]
+        assert model.rowCount(model.index_for_element(storyboard)) == 2